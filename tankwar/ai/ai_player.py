@@ -1,13 +1,23 @@
 from tankwar.ai.black_player import BlackPlayer
 from tankwar.ai.blue_player import BluePlayer
+from tankwar.ai.game_client import GameClient
 from tankwar.ai.green_player import GreenPlayer
 from tankwar.ai.orange_player import OrangePlayer
 from tankwar.ai.purple_player import PurplePlayer
 from tankwar.ai.red_player import RedPlayer
+from tankwar.logic.bot_scheduler import BotScheduler
 
 
 if __name__ == '__main__':
-    ai_players = [ BluePlayer(), OrangePlayer(), RedPlayer(), BlackPlayer(), PurplePlayer(), GreenPlayer()]
+    client = GameClient()
+    ai_players = [ BluePlayer(client), OrangePlayer(client), RedPlayer(client), BlackPlayer(client), PurplePlayer(client), GreenPlayer(client)]
+    # The players play concurrently: a slow one only misses its own turns
+    scheduler = BotScheduler(deadline=0.5)
+    last_turn = None
     while True:
-        for ai_player in ai_players:
-            ai_player.play()
\ No newline at end of file
+        turn = client.wait_turn(last_turn)
+        if turn == last_turn:
+            continue
+        with client.batch():
+            scheduler.run({ai_player.color: (ai_player.play, ()) for ai_player in ai_players})
+        last_turn = turn
\ No newline at end of file
@@ -1,4 +1,3 @@
-import time
 import requests
 import logging
 import traceback
@@ -7,6 +6,7 @@ import json
 from dataclasses import dataclass
 from typing import Optional, Dict, Any, List, Tuple
 from ..logic.orientation import Orientation
+from tankwar.ai.game_client import GameClient
 
 LOG_FILE = "black_player.log"
 GRID_SIZE = 50
@@ -71,7 +71,8 @@ class ScanResult:
 
 
 class BlackPlayer:
-    def __init__(self):
+    def __init__(self, client: Optional[GameClient] = None):
+        self.client = client or GameClient()
         self.color = "black"
         self.last_turn = None
         self.last_action = None
@@ -83,15 +84,16 @@ class BlackPlayer:
         self.path: Optional[List[Orientation]] = None
 
     def get_turn(self):
-        response = requests.get("http://127.0.0.1:5000/turn")
-        return int(response.content.decode("utf-8"))
+        return self.client.get_turn()
+
+    def wait_turn(self):
+        return self.client.wait_turn(self.last_turn)
 
     def play(self):
-        current_turn = self.get_turn()
+        current_turn = self.wait_turn()
         logging.info(f"Current turn: {current_turn}, Last turn: {self.last_turn}")
 
         if current_turn == self.last_turn:
-            time.sleep(0.1)
             return
 
         self.last_turn = current_turn
@@ -123,6 +125,7 @@ class BlackPlayer:
                         results.target_x,
                         results.target_y,
                         self.current_orientation,
+                        *self.client.get_arena_size(),
                     )
                     logging.info(f"Computed path: {self.path}")
 
@@ -197,15 +200,12 @@ class BlackPlayer:
             # For now, raise error as it's a critical issue for AI dev.
             logging.error(f"Invalid action attempted: {action_str}")
             raise ValueError(f"Invalid action: {action_str}")
-        requests.post(
-            "http://127.0.0.1:5000/action",
-            json={"action": action_str, "turn": turn, "color": self.color},
-        )
+        self.client.set_action(self.color, action_str, turn)
 
     def get_scan_results(self) -> Optional[ScanResult]:
         """Fetch and print the scan results for the black tank."""
         try:
-            response = requests.get(f"http://127.0.0.1:5000/scan/{self.color}")
+            response = self.client.get_scan(self.color)
             response.raise_for_status()  # Raise an exception for HTTP errors
             scan_data = response.json()
             if scan_data and "scan" in scan_data and scan_data["scan"]:
@@ -228,7 +228,14 @@ class BlackPlayer:
             return None
 
 
-def get_wrapped_distance(x1: int, y1: int, x2: int, y2: int) -> Tuple[int, int]:
+def get_wrapped_distance(
+    x1: int,
+    y1: int,
+    x2: int,
+    y2: int,
+    grid_width: int = GRID_SIZE,
+    grid_height: int = GRID_SIZE,
+) -> Tuple[int, int]:
     """
     Calculate the shortest distance between two points on a wrapping grid.
     Returns the x and y differences that represent the shortest path.
@@ -239,17 +246,17 @@ def get_wrapped_distance(x1: int, y1: int, x2: int, y2: int) -> Tuple[int, int]:
 
     # Calculate wrapped distance
     wrapped_dx = (
-        dx - GRID_SIZE
-        if dx > GRID_SIZE // 2
-        else dx + GRID_SIZE
-        if dx < -GRID_SIZE // 2
+        dx - grid_width
+        if dx > grid_width // 2
+        else dx + grid_width
+        if dx < -grid_width // 2
         else dx
     )
     wrapped_dy = (
-        dy - GRID_SIZE
-        if dy > GRID_SIZE // 2
-        else dy + GRID_SIZE
-        if dy < -GRID_SIZE // 2
+        dy - grid_height
+        if dy > grid_height // 2
+        else dy + grid_height
+        if dy < -grid_height // 2
         else dy
     )
     # The original code had this, which disables wrapping.
@@ -293,6 +300,8 @@ def compute_fastest_path(
     x_target: int,
     y_target: int,
     current_tank_orientation: Optional[Orientation] = None,
+    grid_width: int = GRID_SIZE,
+    grid_height: int = GRID_SIZE,
 ) -> List[Orientation]:
     """
     Compute the fastest path from (x,y) to (x_target, y_target) on a wrapping grid.
@@ -303,13 +312,15 @@ def compute_fastest_path(
     path_orientations: List[Orientation] = []
     current_x, current_y = x, y
 
-    max_path_len = 2 * GRID_SIZE
+    max_path_len = grid_width + grid_height
 
     for step_num in range(max_path_len):
         if current_x == x_target and current_y == y_target:
             break
 
-        dx, dy = get_wrapped_distance(current_x, current_y, x_target, y_target)
+        dx, dy = get_wrapped_distance(
+            current_x, current_y, x_target, y_target, grid_width, grid_height
+        )
         chosen_orientation: Optional[Orientation] = None
         log_action_type = "greedy"  # Default log type
 
@@ -437,13 +448,13 @@ def compute_fastest_path(
 
         # Update position based on the decided orientation
         if chosen_orientation == Orientation.EAST:
-            current_x = (current_x + 1) % GRID_SIZE
+            current_x = (current_x + 1) % grid_width
         elif chosen_orientation == Orientation.WEST:
-            current_x = (current_x - 1 + GRID_SIZE) % GRID_SIZE
+            current_x = (current_x - 1 + grid_width) % grid_width
         elif chosen_orientation == Orientation.SOUTH:
-            current_y = (current_y + 1) % GRID_SIZE
+            current_y = (current_y + 1) % grid_height
         elif chosen_orientation == Orientation.NORTH:
-            current_y = (current_y - 1 + GRID_SIZE) % GRID_SIZE
+            current_y = (current_y - 1 + grid_height) % grid_height
 
         if chosen_orientation:
             logging.debug(
@@ -1,10 +1,9 @@
 import json
 import random
-import time
-import requests
 from dataclasses import dataclass
 from typing import Optional
 from ..logic.orientation import Orientation
+from tankwar.ai.game_client import GameClient
 import logging
 
 
@@ -36,15 +35,18 @@ class State:
 
 
 class BluePlayer:
-    def __init__(self):
+    def __init__(self, client: Optional[GameClient] = None):
+        self.client = client or GameClient()
         self.color = "blue"
         self.last_turn = None
         self.state = State.ASKED_FOR_SCAN
         self.scan = ScanResult(0, 0, 0, self.color, Orientation.NORTH, Orientation.NORTH, 0, 0)
 
     def get_turn(self):
-        response = requests.get("http://127.0.0.1:5000/turn")
-        return int(response.content.decode("utf-8"))
+        return self.client.get_turn()
+
+    def wait_turn(self):
+        return self.client.wait_turn(self.last_turn)
 
     def play(self):
         try:
@@ -53,9 +55,10 @@ class BluePlayer:
             print(f"Error in BluePlayer: {e}")
 
     def inner_play(self):
-        current_turn = self.get_turn()
+        current_turn = self.wait_turn()
         if current_turn == self.last_turn:
             return 
+        self.last_turn = current_turn
 
         if current_turn == 0:
             self.state = State.ASKED_FOR_SCAN
@@ -120,7 +123,7 @@ class BluePlayer:
 
     def get_scan(self) -> ScanResult:
         try:
-            response = requests.get(f"http://127.0.0.1:5000/scan/{self.color}")
+            response = self.client.get_scan(self.color)
             if response.status_code == 200:
                 data = response.json()
 
@@ -155,7 +158,7 @@ class BluePlayer:
             raise Exception(f"Error getting scan: {e}") from e
     
     def forward(self):
-        self.set_action("FORWARD", self.get_turn())
+        self.set_action("FORWARD", self.last_turn)
         match self.scan.orientation:
             case Orientation.NORTH:
                 self.scan.y -= 1
@@ -166,27 +169,28 @@ class BluePlayer:
             case Orientation.WEST:
                 self.scan.x += 1
 
-        self.scan.x = self.scan.x % 50
-        self.scan.y = self.scan.y % 50
+        cell_per_row, cell_per_col = self.client.get_arena_size()
+        self.scan.x = self.scan.x % cell_per_row
+        self.scan.y = self.scan.y % cell_per_col
         print(f"Moving to {self.scan.x}, {self.scan.y}")
 
     def rotate(self, new_orientation: Orientation):
         if new_orientation == Orientation.NORTH:
-            self.set_action("TURN_LEFT", self.get_turn())
+            self.set_action("TURN_LEFT", self.last_turn)
             self.scan.orientation = Orientation.WEST
         elif new_orientation == Orientation.SOUTH:
-            self.set_action("TURN_RIGHT", self.get_turn())
+            self.set_action("TURN_RIGHT", self.last_turn)
             self.scan.orientation = Orientation.EAST
         elif new_orientation == Orientation.EAST:
-            self.set_action("TURN_RIGHT", self.get_turn())
+            self.set_action("TURN_RIGHT", self.last_turn)
             self.scan.orientation = Orientation.SOUTH
         elif new_orientation == Orientation.WEST:
-            self.set_action("TURN_LEFT", self.get_turn())
+            self.set_action("TURN_LEFT", self.last_turn)
             self.scan.orientation = Orientation.NORTH
 
     def fire(self):
-        self.set_action("FIRE", self.get_turn())
+        self.set_action("FIRE", self.last_turn)
         
     def set_action(self, action_str, turn):
         print(f"Setting action: {action_str} for turn {turn}")
-        requests.post(f"http://127.0.0.1:5000/action",json={"action": action_str, "turn": turn, "color": self.color})
\ No newline at end of file
+        self.client.set_action(self.color, action_str, turn)
\ No newline at end of file
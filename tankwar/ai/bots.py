@@ -0,0 +1,37 @@
+import random
+
+from tankwar.ai.pathfinding import path_table
+from tankwar.logic.bot import Observation
+from tankwar.logic.tank import Action
+
+class RandomBot:
+    """
+    Plays a random action every turn.
+    """
+
+    ACTIONS = [Action.FORWARD, Action.TURN_LEFT, Action.TURN_RIGHT, Action.TURN_TURRET_LEFT, Action.TURN_TURRET_RIGHT, Action.FIRE]
+
+    def __init__(self, seed: int = None):
+        self.random = random.Random(seed)
+
+    def decide(self, observation: Observation) -> Action:
+        return self.random.choice(self.ACTIONS)
+
+class TargetSeekerBot:
+    """
+    Drives to its target along a shortest path of the toroidal arena.
+    """
+
+    def __init__(self, seed: int = None):
+        pass
+
+    def decide(self, observation: Observation) -> Action:
+        if observation.target_x is None:
+            return None
+        table = path_table(observation.cell_per_row, observation.cell_per_col)
+        return table.next_action(observation.x, observation.y, observation.orientation, observation.target_x, observation.target_y)
+
+BOTS = {
+    "random": RandomBot,
+    "seeker": TargetSeekerBot,
+}
@@ -0,0 +1,70 @@
+import contextlib
+import threading
+
+import requests
+
+SERVER_URL = "http://127.0.0.1:5000"
+
+class GameClient:
+    """
+    HTTP client shared by the bundled players.
+
+    All requests go through a keep-alive session, one per thread since sessions
+    are not thread safe. Inside a batch() block,
+    actions are queued and submitted together in a single POST /actions when
+    the block exits.
+    """
+
+    def __init__(self, server_url: str = SERVER_URL):
+        self.server_url = server_url
+        self.local = threading.local()
+        self.pending_actions = None
+        self.arena_size = None
+
+    @property
+    def session(self) -> requests.Session:
+        session = getattr(self.local, "session", None)
+        if session is None:
+            session = self.local.session = requests.Session()
+        return session
+
+    def get_turn(self) -> int:
+        response = self.session.get(f"{self.server_url}/turn")
+        return int(response.content.decode("utf-8"))
+
+    def wait_turn(self, after) -> int:
+        response = self.session.get(f"{self.server_url}/turn/wait", params={"after": after})
+        return int(response.content.decode("utf-8"))
+
+    def get_arena_size(self) -> tuple[int, int]:
+        if self.arena_size is None:
+            arena = self.session.get(f"{self.server_url}/status").json()["arena"]
+            self.arena_size = (arena["cell_per_row"], arena["cell_per_col"])
+        return self.arena_size
+
+    def get_status(self) -> dict:
+        return self.session.get(f"{self.server_url}/status").json()
+
+    def get_scan(self, color: str) -> requests.Response:
+        return self.session.get(f"{self.server_url}/scan/{color}")
+
+    def set_action(self, color: str, action_str: str, turn: int):
+        action = {"action": action_str, "turn": turn, "color": color}
+        if self.pending_actions is not None:
+            self.pending_actions.append(action)
+            return
+        self.session.post(f"{self.server_url}/action", json=action)
+
+    def flush(self):
+        pending_actions, self.pending_actions = self.pending_actions, []
+        if pending_actions:
+            self.session.post(f"{self.server_url}/actions", json=pending_actions)
+
+    @contextlib.contextmanager
+    def batch(self):
+        self.pending_actions = []
+        try:
+            yield self
+            self.flush()
+        finally:
+            self.pending_actions = None
@@ -1,21 +1,24 @@
 import random
-import time
-import requests
+from typing import Optional
+
+from tankwar.ai.game_client import GameClient
 
 
 class GreenPlayer:
-    def __init__(self):
+    def __init__(self, client: Optional[GameClient] = None):
+        self.client = client or GameClient()
         self.color = "green"
         self.last_turn = None
 
     def get_turn(self):
-        response = requests.get("http://127.0.0.1:5000/turn")
-        return int(response.content.decode("utf-8"))
+        return self.client.get_turn()
+
+    def wait_turn(self):
+        return self.client.wait_turn(self.last_turn)
     
     def play(self):
-        current_turn = self.get_turn()
+        current_turn = self.wait_turn()
         if current_turn == self.last_turn:
-            time.sleep(0.1)
             return 
         self.last_turn = current_turn
         random_action = random.choice([
@@ -32,4 +35,4 @@ class GreenPlayer:
         self.set_action(random_action, current_turn)
         
     def set_action(self, action_str, turn):
-        requests.post(f"http://127.0.0.1:5000/action",json={"action": action_str, "turn": turn, "color": self.color})            
+        self.client.set_action(self.color, action_str, turn)            
@@ -0,0 +1,52 @@
+from typing import Optional
+
+from tankwar.ai.game_client import GameClient
+from tankwar.logic.bot import Bot, Observation
+from tankwar.logic.bot_scheduler import BotScheduler
+
+class HttpBotAdapter:
+    """
+    Runs in-process bots against a remote game through the HTTP server.
+
+    Every turn costs one long-poll for the turn, one GET /status shared by all
+    the bots and one batched POST /actions, whatever the number of bots. The
+    bots decide concurrently, and the ones late for the deadline skip the turn.
+    """
+
+    def __init__(self, bots: dict[str, Bot], client: Optional[GameClient] = None, deadline: float = 0.5):
+        self.bots = bots
+        self.client = client or GameClient()
+        self.scheduler = BotScheduler(deadline)
+        self.last_turn = None
+
+    def play(self):
+        turn = self.client.wait_turn(self.last_turn)
+        if turn == self.last_turn:
+            # The long-poll timed out without a new turn
+            return
+        state = self.client.get_status()
+        observations = {color: Observation.from_state(state, color) for color in self.bots}
+        actions = self.scheduler.decide(self.bots, {color: observation for color, observation in observations.items() if observation is not None})
+        with self.client.batch():
+            for color, action in actions.items():
+                if action is not None:
+                    self.client.set_action(color, action.name, state["turn"])
+        self.last_turn = turn
+
+    def run(self):
+        while True:
+            self.play()
+
+if __name__ == '__main__':
+    import argparse
+    from tankwar.ai.bots import BOTS
+    parser = argparse.ArgumentParser(description="Play in-process bots against a running game over HTTP")
+    parser.add_argument("bots", nargs="+", metavar="COLOR=BOT", help=f"e.g. blue=seeker, bots among {', '.join(BOTS)}")
+    parser.add_argument("--server", default="http://127.0.0.1:5000")
+    parser.add_argument("--deadline", type=float, default=0.5, help="seconds the bots have to decide every turn")
+    args = parser.parse_args()
+    bots = {}
+    for bot_arg in args.bots:
+        color, name = bot_arg.split("=")
+        bots[color] = BOTS[name]()
+    HttpBotAdapter(bots, GameClient(args.server), args.deadline).run()
@@ -1,9 +1,11 @@
 import random
-import time
 import json
 from dataclasses import dataclass
+from typing import Optional
 
-import requests
+from tankwar.ai.game_client import GameClient
+from tankwar.ai.pathfinding import path_table
+from tankwar.logic.orientation import Orientation
 
 
 @dataclass
@@ -19,7 +21,8 @@ class ScanResult:
 
 
 class OrangePlayer:
-    def __init__(self):
+    def __init__(self, client: Optional[GameClient] = None):
+        self.client = client or GameClient()
         self.color = "orange"
         self.last_turn = None
         self.turn_of_last_scan = None
@@ -31,8 +34,10 @@ class OrangePlayer:
         self.target_y = None
 
     def get_turn(self):
-        response = requests.get("http://127.0.0.1:5000/turn")
-        return int(response.content.decode("utf-8"))
+        return self.client.get_turn()
+
+    def wait_turn(self):
+        return self.client.wait_turn(self.last_turn)
 
     def parse_scan_result(self, scan_result_str):
         """
@@ -63,59 +68,21 @@ class OrangePlayer:
 
     def choose_action(self, x, y, orientation, target_x, target_y):
         """
-        Choose an action to move toward the target by:
-        1. Using current orientation if it's beneficial
-        2. Moving along one axis at a time
-        3. Turning only when necessary
+        Choose the action that gets us one turn closer to the target, along a
+        shortest path of the toroidal arena.
         """
         print(f"Position: ({x},{y}), Target: ({target_x},{target_y}), Orientation: {orientation}")
 
-        # Check if already at target position
-        if x == target_x and y == target_y:
+        table = path_table(*self.client.get_arena_size())
+        action = table.next_action(x, y, Orientation(orientation), target_x, target_y)
+        if action is None:
+            # Already at target position
             return "SCAN"
-
-
-
-        # First, leverage current orientation
-        if orientation == 1:  # NORTH
-            if y > target_y:  # Target is above us (north)
-                return "FORWARD"
-            elif y < target_y:  # Target is below us (south)
-                return "BACKWARD"
-            else:  # Same y, need to move on x-axis
-                return "TURN_RIGHT" if x < target_x else "TURN_LEFT"
-
-        elif orientation == 3:  # SOUTH
-            if y < target_y:  # Target is below us (south)
-                return "FORWARD"
-            elif y > target_y:  # Target is above us (north)
-                return "BACKWARD"
-            else:  # Same y, need to move on x-axis
-                return "TURN_RIGHT" if x > target_x else "TURN_LEFT"
-
-        elif orientation == 4:  # EAST
-            if x < target_x:  # Target is to our right (east)
-                return "FORWARD"
-            elif x > target_x:  # Target is to our left (west)
-                return "BACKWARD"
-            else:  # Same x, need to move on y-axis
-                return "TURN_RIGHT" if y > target_y else "TURN_LEFT"
-
-        elif orientation == 2:  # WEST
-            if x > target_x:  # Target is to our left (west)
-                return "FORWARD"
-            elif x < target_x:  # Target is to our right (east)
-                return "BACKWARD"
-            else:  # Same x, need to move on y-axis
-                return "TURN_RIGHT" if y < target_y else "TURN_LEFT"
-
-        # Fallback action if something unexpected happens
-        return "SCAN"
+        return action.name
 
     def play(self):
-        current_turn = self.get_turn()
+        current_turn = self.wait_turn()
         if current_turn == self.last_turn:
-            time.sleep(0.1)
             return
         self.last_turn = current_turn
 
@@ -147,7 +114,7 @@ class OrangePlayer:
             self.update_position_based_on_action(action)
 
     def update_position_from_scan(self):
-        scan_str = requests.get(f"http://127.0.0.1:5000/scan/{self.color}").content.decode("utf-8")
+        scan_str = self.client.get_scan(self.color).content.decode("utf-8")
         scan_result = self.parse_scan_result(scan_str)
         self.current_x = scan_result.x
         self.current_y = scan_result.y
@@ -198,5 +165,5 @@ class OrangePlayer:
         print(f"Updated position after {action}: ({self.current_x},{self.current_y}), orientation: {self.current_orientation}")
 
     def set_action(self, action_str, turn):
-        requests.post(f"http://127.0.0.1:5000/action",json={"action": action_str, "turn": turn, "color": self.color})
+        self.client.set_action(self.color, action_str, turn)
 
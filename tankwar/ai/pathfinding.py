@@ -0,0 +1,104 @@
+from array import array
+from collections import deque
+from functools import lru_cache
+
+from tankwar.logic.orientation import Orientation
+from tankwar.logic.tank import Action
+
+# Actions a tank can take to move, each costing one turn, in order of preference
+MOVES = [Action.FORWARD, Action.BACKWARD, Action.TURN_LEFT, Action.TURN_RIGHT]
+# Cell offset of a forward move, for each orientation
+FORWARD_OFFSETS = {
+    Orientation.NORTH: (0, -1),
+    Orientation.WEST: (-1, 0),
+    Orientation.SOUTH: (0, 1),
+    Orientation.EAST: (1, 0),
+}
+ORIENTATIONS = list(Orientation)
+NO_ACTION = 255
+
+class PathTable:
+    """
+    Optimal next move toward a target, for every offset to the target on the
+    toroidal arena and every orientation of the tank.
+
+    The arena wraps around, so the best move only depends on the offset
+    (target - position) modulo the arena size, not on where the tank is. The
+    table holds, for each of the cell_per_row * cell_per_col * 4 states, the
+    number of turns to the target and the move that gets one turn closer,
+    computed once with a breadth first search from the target.
+    """
+
+    def __init__(self, cell_per_row: int, cell_per_col: int):
+        self.cell_per_row = cell_per_row
+        self.cell_per_col = cell_per_col
+        size = cell_per_row * cell_per_col * len(ORIENTATIONS)
+        self.distances = array("i", [-1]) * size
+        self.moves = bytearray([NO_ACTION]) * size
+        self.build()
+
+    def state(self, dx: int, dy: int, orientation_index: int) -> int:
+        return (dy * self.cell_per_row + dx) * len(ORIENTATIONS) + orientation_index
+
+    def after(self, dx: int, dy: int, orientation_index: int, move: Action) -> tuple[int, int, int]:
+        """
+        The state reached from (dx, dy, orientation) with a move, dx and dy
+        being the offset from the tank to the target.
+        """
+        if move == Action.TURN_LEFT:
+            return dx, dy, (orientation_index + 1) % len(ORIENTATIONS)
+        if move == Action.TURN_RIGHT:
+            return dx, dy, (orientation_index - 1) % len(ORIENTATIONS)
+        step_x, step_y = FORWARD_OFFSETS[ORIENTATIONS[orientation_index]]
+        if move == Action.BACKWARD:
+            step_x, step_y = -step_x, -step_y
+        # The tank moves by step, so the offset to the target moves the other way
+        return (dx - step_x) % self.cell_per_row, (dy - step_y) % self.cell_per_col, orientation_index
+
+    def build(self):
+        # Every move can be undone by another one, so the distances from the
+        # target are the distances to the target
+        queue = deque()
+        for orientation_index in range(len(ORIENTATIONS)):
+            self.distances[self.state(0, 0, orientation_index)] = 0
+            queue.append((0, 0, orientation_index))
+        while queue:
+            dx, dy, orientation_index = queue.popleft()
+            distance = self.distances[self.state(dx, dy, orientation_index)]
+            for move in MOVES:
+                neighbour = self.after(dx, dy, orientation_index, move)
+                neighbour_state = self.state(*neighbour)
+                if self.distances[neighbour_state] < 0:
+                    self.distances[neighbour_state] = distance + 1
+                    queue.append(neighbour)
+
+        for dy in range(self.cell_per_col):
+            for dx in range(self.cell_per_row):
+                for orientation_index in range(len(ORIENTATIONS)):
+                    state = self.state(dx, dy, orientation_index)
+                    for i, move in enumerate(MOVES):
+                        if self.distances[self.state(*self.after(dx, dy, orientation_index, move))] == self.distances[state] - 1:
+                            self.moves[state] = i
+                            break
+
+    def lookup(self, x: int, y: int, orientation: Orientation, target_x: int, target_y: int) -> int:
+        dx = (target_x - x) % self.cell_per_row
+        dy = (target_y - y) % self.cell_per_col
+        return self.state(dx, dy, ORIENTATIONS.index(orientation))
+
+    def next_action(self, x: int, y: int, orientation: Orientation, target_x: int, target_y: int) -> Action:
+        """
+        The move that gets the tank one turn closer to the target, None when it is on the target.
+        """
+        move = self.moves[self.lookup(x, y, orientation, target_x, target_y)]
+        return MOVES[move] if move != NO_ACTION else None
+
+    def turns_to(self, x: int, y: int, orientation: Orientation, target_x: int, target_y: int) -> int:
+        return self.distances[self.lookup(x, y, orientation, target_x, target_y)]
+
+@lru_cache(maxsize=8)
+def path_table(cell_per_row: int, cell_per_col: int) -> PathTable:
+    """
+    The path table of an arena size, built on first use and shared by every bot.
+    """
+    return PathTable(cell_per_row, cell_per_col)
@@ -0,0 +1,239 @@
+import json
+import math
+import os
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+from tankwar.ai.bots import RandomBot
+from tankwar.logic.explosion import Explosion
+from tankwar.logic.game import Game
+from tankwar.logic.game_config import GameConfig
+from tankwar.logic.game_writer import GameWriter
+from tankwar.logic.missile import Missile
+from tankwar.logic.orientation import Orientation
+from tankwar.logic.state_channel import DELTA_CHANNEL_SIZE, StateChannel
+from tankwar.logic.tank import Action, Tank
+from tankwar.logic.tank_scanner import ScanResult
+from tankwar.logic.target import Target
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "benchmark_baseline.json")
+
+# Actions of the updater benchmark, without scans so that the timings stay comparable with the baseline
+UPDATE_ACTIONS = [action for action in Action if action != Action.SCAN]
+
+def synthetic_game(arena_size: int, tank_count: int, missile_count: int, seed: int = 0) -> Game:
+    """
+    A headless game with tanks spawned at random and missiles flying in random
+    directions from random cells. Every tank starts on its own target.
+    """
+    game = Game(GameConfig.scaled(arena_size, tank_count, spawn_policy="random", seed=seed), headless=True)
+    orientations = list(Orientation)
+    for i in range(missile_count):
+        x = game.random.randrange(arena_size)
+        y = game.random.randrange(arena_size)
+        missile = Missile(x, y, game.random.choice(orientations), game.tanks[i % tank_count].color)
+        game.registry.add(missile)
+        game.arena.missile_index.add(missile)
+    return game
+
+def best_time(prepare, run, repeat: int) -> float:
+    """
+    Best wall time of run(prepare()) over the repetitions, prepare being left out of the timing.
+    """
+    best = math.inf
+    for _ in range(repeat):
+        world = prepare()
+        started = time.perf_counter()
+        run(world)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def bench_missile_collider(missiles: int, repeat: int) -> float:
+    return best_time(lambda: synthetic_game(1000, 6, missiles), lambda game: game.missile_collider.collide(), repeat)
+
+def bench_target_collider(tanks: int, repeat: int) -> float:
+    return best_time(lambda: synthetic_game(200, tanks, 0), lambda game: game.target_collider.collide(), repeat)
+
+def bench_tank_mover(tanks: int, repeat: int) -> float:
+    def move_all(game: Game):
+        for tank in game.tanks:
+            game.tank_updater.tank_mover.move_forward(tank, game.arena)
+    return best_time(lambda: synthetic_game(200, tanks, 0), move_all, repeat)
+
+def bench_tank_updater(tanks: int, repeat: int) -> float:
+    def prepare() -> Game:
+        game = synthetic_game(200, tanks, 0)
+        for tank in game.tanks:
+            tank.set_next_action(game.random.choice(UPDATE_ACTIONS))
+        return game
+    def update_all(game: Game):
+        for tank in game.tanks:
+            game.tank_updater.update(game.turn, tank)
+    return best_time(prepare, update_all, repeat)
+
+def bench_game_writer(missiles: int, repeat: int) -> float:
+    game = synthetic_game(1000, 6, missiles)
+    writer = GameWriter()
+    # Channels of their own, so that a running game is not disturbed
+    writer.state_channel = StateChannel("tankwar_benchmark_state", create=True)
+    writer.delta_channel = StateChannel("tankwar_benchmark_deltas", create=True, size=DELTA_CHANNEL_SIZE)
+    try :
+        writer.write(game)
+        def prepare() -> Game:
+            game.step()
+            return game
+        return best_time(prepare, writer.write, repeat)
+    finally:
+        writer.close()
+
+def bench_turn(cells: int, repeat: int) -> float:
+    def prepare() -> Game:
+        game = synthetic_game(math.isqrt(cells), 6, 100)
+        for i, tank in enumerate(game.tanks):
+            game.bots[tank.color] = RandomBot(i)
+        return game
+    return best_time(prepare, lambda game: game.run_turns(10), repeat) / 10
+
+@dataclass
+class Benchmark:
+    name: str
+    run: callable
+    sizes: list[int]
+    # What the size counts, the cost per unit is reported in µs
+    unit: str
+
+BENCHMARKS = [
+    Benchmark("MissileCollider.collide", bench_missile_collider, [10, 100, 1000, 10000], "missile"),
+    Benchmark("TargetCollider.collide", bench_target_collider, [6, 60, 300, 1000], "tank"),
+    Benchmark("TankMover.move_forward", bench_tank_mover, [6, 60, 300, 1000], "tank"),
+    Benchmark("TankUpdater.update", bench_tank_updater, [6, 60, 300, 1000], "tank"),
+    Benchmark("GameWriter.write", bench_game_writer, [10, 100, 1000, 10000], "missile"),
+    Benchmark("Game turn", bench_turn, [50 ** 2, 200 ** 2, 500 ** 2, 1000 ** 2], "cell"),
+]
+
+def scaling_exponent(sizes: list[int], seconds: list[float]) -> float:
+    """
+    Slope of the log-log fit of the time against the size: about 1 for a linear
+    cost, 2 for a quadratic one and 0 for a cost that does not depend on the size.
+    """
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(second, 1e-9)) for second in seconds]
+    x_mean, y_mean = sum(xs) / len(xs), sum(ys) / len(ys)
+    return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / sum((x - x_mean) ** 2 for x in xs)
+
+def run_benchmark(benchmark: Benchmark, repeat: int = 5) -> dict:
+    seconds = [benchmark.run(size, repeat) for size in benchmark.sizes]
+    return {
+        "sizes": benchmark.sizes,
+        "calls_per_second": [1 / second for second in seconds],
+        "us_per_unit": [second * 1e6 / size for size, second in zip(benchmark.sizes, seconds)],
+        "exponent": scaling_exponent(benchmark.sizes, seconds),
+    }
+
+def compare(name: str, result: dict, baseline: dict, exponent_tolerance: float, max_slowdown: float) -> list[str]:
+    """
+    Regressions of a benchmark against its baseline: a steeper scaling curve, or
+    a cost per unit at the largest size more than max_slowdown times the baseline one.
+    """
+    regressions = []
+    if result["exponent"] > baseline["exponent"] + exponent_tolerance:
+        regressions.append(f"{name}: scales as n^{result['exponent']:.2f}, baseline n^{baseline['exponent']:.2f}")
+    if result["sizes"] == baseline["sizes"]:
+        slowdown = result["us_per_unit"][-1] / baseline["us_per_unit"][-1]
+        if slowdown > max_slowdown:
+            regressions.append(f"{name}: {slowdown:.1f}x slower than the baseline at {result['sizes'][-1]}")
+    return regressions
+
+# Constructor arguments of every entity class for the memory benchmark
+ENTITY_ARGUMENTS = {
+    Tank: (0, 0, "blue"),
+    Missile: (0, 0, Orientation.NORTH, "blue"),
+    Target: (0, 0, "blue"),
+    Explosion: (0, 0),
+    ScanResult: (0, 0, 0, "blue", Orientation.NORTH, Orientation.NORTH, 0, 0),
+}
+
+def bytes_per_entity(entity_class: type, arguments: tuple, count: int = 10000) -> float:
+    entities = []
+    tracemalloc.start()
+    try :
+        before = tracemalloc.get_traced_memory()[0]
+        entities.extend(entity_class(*arguments) for _ in range(count))
+        return (tracemalloc.get_traced_memory()[0] - before) / count
+    finally:
+        tracemalloc.stop()
+
+def dict_class(entity_class: type) -> type:
+    """
+    The same entity class with a __dict__ instead of __slots__, as the entities were before.
+    """
+    return type(entity_class.__name__, (), {"__init__": entity_class.__init__})
+
+def allocations_per_turn(pooled: bool, turns: int = 1000) -> tuple[float, float]:
+    """
+    Missiles and explosions allocated per turn, and seconds per turn, of a
+    crowded match of random bots, with or without reusing them.
+    """
+    game = synthetic_game(50, 100, 0)
+    for i, tank in enumerate(game.tanks):
+        game.bots[tank.color] = RandomBot(i)
+    if not pooled:
+        game.missile_pool.max_free = game.explosion_pool.max_free = 0
+    started = time.perf_counter()
+    game.run_turns(turns)
+    elapsed = time.perf_counter() - started
+    return (game.missile_pool.allocated + game.explosion_pool.allocated) / turns, elapsed / turns
+
+def memory_report():
+    print(f"{'entity':<12}{'bytes with __dict__':>20}{'bytes with __slots__':>22}")
+    for entity_class, arguments in ENTITY_ARGUMENTS.items():
+        print(f"{entity_class.__name__:<12}{bytes_per_entity(dict_class(entity_class), arguments):>20.0f}{bytes_per_entity(entity_class, arguments):>22.0f}")
+    print(f"{'pools':<12}{'allocations/turn':>20}{'µs/turn':>22}")
+    for pooled in (False, True):
+        allocations, seconds = allocations_per_turn(pooled)
+        print(f"{'on' if pooled else 'off':<12}{allocations:>20.2f}{seconds * 1e6:>22.1f}")
+
+if __name__ == '__main__':
+    import argparse
+    import sys
+    parser = argparse.ArgumentParser(description="Time the logic of the game on synthetic worlds of growing size and compare with a baseline")
+    parser.add_argument("--only", action="append", metavar="NAME", help="run the benchmarks whose name contains NAME; can be repeated")
+    parser.add_argument("--repeat", type=int, default=5, help="the best of this many runs is kept for every size")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the new baseline instead of comparing")
+    parser.add_argument("--exponent-tolerance", type=float, default=0.3)
+    parser.add_argument("--max-slowdown", type=float, default=3., help="tolerated cost ratio to the baseline at the largest size, as machines differ")
+    parser.add_argument("--memory", action="store_true", help="print the bytes per entity and the entity allocations per turn instead")
+    args = parser.parse_args()
+
+    if args.memory:
+        memory_report()
+        sys.exit(0)
+
+    benchmarks = [benchmark for benchmark in BENCHMARKS if not args.only or any(name in benchmark.name for name in args.only)]
+    try :
+        with open(args.baseline) as f:
+            baselines = json.load(f)
+    except FileNotFoundError:
+        baselines = {}
+
+    results, regressions = {}, []
+    for benchmark in benchmarks:
+        result = results[benchmark.name] = run_benchmark(benchmark, args.repeat)
+        print(f"{benchmark.name}  (n = {benchmark.unit}s)  scales as n^{result['exponent']:.2f}")
+        print(f"  {'n':>8}{'calls/s':>12}{'µs/' + benchmark.unit:>16}")
+        for size, calls, cost in zip(result["sizes"], result["calls_per_second"], result["us_per_unit"]):
+            print(f"  {size:>8}{calls:>12.1f}{cost:>16.4g}")
+        if not args.save_baseline and benchmark.name in baselines:
+            regressions += compare(benchmark.name, result, baselines[benchmark.name], args.exponent_tolerance, args.max_slowdown)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump({**baselines, **results}, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+    elif regressions:
+        print("Regressions:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
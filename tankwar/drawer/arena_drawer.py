@@ -3,13 +3,28 @@ import pygame
 from tankwar.logic.arena import Arena 
 
 class ArenaDrawer:
-    def __init__(self):
-        self.cell_size_in_pixels = 20
+    def __init__(self, cell_size_in_pixels: int = 20):
+        self.cell_size_in_pixels = cell_size_in_pixels
+
+    @staticmethod
+    def cell_size_for(arena: Arena, max_size_in_pixels: int = 1000) -> int:
+        return max(1, min(20, max_size_in_pixels // max(arena.cell_per_row, arena.cell_per_col)))
+
+    def cell_rect(self, x: int, y: int) -> pygame.Rect:
+        return pygame.Rect(x * self.cell_size_in_pixels, y * self.cell_size_in_pixels, self.cell_size_in_pixels, self.cell_size_in_pixels)
+
+    def render(self, arena: Arena, size: tuple[int, int]) -> pygame.Surface:
+        background = pygame.Surface(size)
+        background.fill((0, 0, 0))
+        self.draw(arena, background)
+        return background
 
     def draw(self, arena: Arena, window : pygame.Surface):
-        for row in range(arena.cell_per_row):
-            for col in range(arena.cell_per_col):
+        # Cells smaller than 3 pixels have no room for a border
+        border = 1 if self.cell_size_in_pixels > 2 else 0
+        for col in range(arena.cell_per_row):
+            for row in range(arena.cell_per_col):
                 x = col * self.cell_size_in_pixels
                 y = row * self.cell_size_in_pixels
 
-                pygame.draw.rect(window, (255, 255, 255), (x+1, y+1, self.cell_size_in_pixels-2, self.cell_size_in_pixels-2), 0)
\ No newline at end of file
+                pygame.draw.rect(window, (255, 255, 255), (x+border, y+border, self.cell_size_in_pixels-2*border, self.cell_size_in_pixels-2*border), 0)
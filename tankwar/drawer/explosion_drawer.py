@@ -1,13 +1,11 @@
-import pygame
-
 from arena_drawer import ArenaDrawer
 from tankwar.logic.explosion import Explosion
-from tankwar.drawer.images import IMAGE_PATH
+from tankwar.drawer.images import load_image
 
 class ExplosionDrawer:
 
-    def __init__(self):
-        self.image = pygame.image.load(IMAGE_PATH.joinpath("explosion.png"))
+    def __init__(self, cell_size_in_pixels: int = 20):
+        self.image = load_image("explosion.png", cell_size_in_pixels)
 
     def draw(self, window, arena_drawer : ArenaDrawer, explosion: Explosion):
         window.blit(self.image, (explosion.x * arena_drawer.cell_size_in_pixels, explosion.y * arena_drawer.cell_size_in_pixels))
\ No newline at end of file
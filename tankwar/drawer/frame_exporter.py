@@ -0,0 +1,161 @@
+import os
+# Render off-screen: no window is ever opened
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+# The pygame banner would end up in the middle of raw frames written to stdout
+os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pygame
+
+from arena_drawer import ArenaDrawer
+from explosion_drawer import ExplosionDrawer
+from game_drawer import entities_from_state, hud_lines, window_size
+from missile_drawer import MissileDrawer
+from tank_drawer import TankDrawer
+from target_drawer import TargetDrawer
+from text_cache import TextCache
+from tankwar.logic.arena import Arena
+from tankwar.logic.snapshot_codec import decode_snapshot
+from tankwar.logic.snapshot_file import SnapshotFileWriter, read_snapshots
+from tankwar.logic.state_channel import reopen
+
+class FrameRenderer:
+    """
+    Renders snapshots to off-screen surfaces laid out like the game window.
+    """
+
+    def __init__(self, cell_per_row: int, cell_per_col: int):
+        pygame.init()
+        self.arena = Arena(cell_per_row, cell_per_col)
+        cell_size_in_pixels = ArenaDrawer.cell_size_for(self.arena)
+        self.arena_drawer = ArenaDrawer(cell_size_in_pixels)
+        self.explosion_drawer = ExplosionDrawer(cell_size_in_pixels)
+        self.missile_drawer = MissileDrawer(cell_size_in_pixels)
+        self.tank_drawer = TankDrawer(cell_size_in_pixels)
+        self.target_drawer = TargetDrawer(cell_size_in_pixels)
+        self.text_cache = TextCache(pygame.font.Font(None, 36))
+
+        self.hud_x = cell_per_row * cell_size_in_pixels + 50
+        self.size = window_size(self.arena, cell_size_in_pixels)
+        self.background = self.arena_drawer.render(self.arena, self.size)
+
+    def render(self, snapshot: bytes) -> pygame.Surface:
+        json_dict = decode_snapshot(snapshot)
+        tanks, missiles, explosions, targets = entities_from_state(json_dict)
+
+        frame = self.background.copy()
+        for target in targets:
+            self.target_drawer.draw(frame, self.arena_drawer, target)
+        for tank in tanks:
+            self.tank_drawer.draw(frame, self.arena_drawer, tank)
+        for missile in missiles:
+            self.missile_drawer.draw(frame, self.arena_drawer, missile)
+        for explosion in explosions:
+            self.explosion_drawer.draw(frame, self.arena_drawer, explosion)
+
+        lines = hud_lines(json_dict["turn"], json_dict["status"], json_dict["players"], tanks, targets, json_dict["scores"], self.size[1])
+        for text, text_color, (x, y) in lines:
+            frame.blit(self.text_cache.render(text, text_color), (self.hud_x + x, y))
+        return frame
+
+# One renderer per worker process, created once by the pool initializer
+renderer = None
+
+def init_worker(cell_per_row: int, cell_per_col: int):
+    global renderer
+    renderer = FrameRenderer(cell_per_row, cell_per_col)
+
+def render_png(task: tuple[int, bytes, str]) -> str:
+    index, snapshot, output_dir = task
+    path = os.path.join(output_dir, f"frame_{index:06d}.png")
+    pygame.image.save(renderer.render(snapshot), path)
+    return path
+
+def render_rgb(snapshot: bytes) -> bytes:
+    return pygame.image.tobytes(renderer.render(snapshot), "RGB")
+
+def export_frames(snapshots, output_dir: str = None, stream = None, workers: int = None, chunksize: int = 8) -> int:
+    """
+    Render every snapshot either to numbered PNG files in output_dir, or as
+    raw RGB frames written in order to stream (for instance the stdin of ffmpeg).
+    Frames are rendered in parallel by a pool of processes.
+    """
+    snapshots = iter(snapshots)
+    first = next(snapshots, None)
+    if first is None:
+        return 0
+    arena = decode_snapshot(first)["arena"]
+
+    def all_snapshots():
+        yield first
+        yield from snapshots
+
+    frames = 0
+    with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(arena["cell_per_row"], arena["cell_per_col"])) as executor:
+        if output_dir is not None:
+            os.makedirs(output_dir, exist_ok=True)
+            tasks = ((index, snapshot, output_dir) for index, snapshot in enumerate(all_snapshots()))
+            for _ in executor.map(render_png, tasks, chunksize=chunksize):
+                frames += 1
+        else:
+            for frame in executor.map(render_rgb, all_snapshots(), chunksize=chunksize):
+                stream.write(frame)
+                frames += 1
+    return frames
+
+def record(path: str, turns: int = None, poll_interval: float = 0.01):
+    """
+    Append the snapshot of every turn published by the running game to a
+    file, until the game exits.
+    """
+    channel = reopen(None)
+    writer = SnapshotFileWriter(path)
+    recorded = 0
+    turn = None
+    try :
+        while turns is None or recorded < turns:
+            new_turn = channel.read_turn()
+            if new_turn == turn:
+                # Checked once the last turn is recorded, the game publishes nothing after it exits
+                if not channel.is_live():
+                    break
+                time.sleep(poll_interval)
+                continue
+            turn, snapshot = channel.read()
+            writer.append(snapshot)
+            recorded += 1
+    except (KeyboardInterrupt, FileNotFoundError):
+        # Interrupted, or the game died in the middle of a turn
+        pass
+    finally:
+        writer.close()
+        channel.close()
+    return recorded
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description="Record a running game and render recorded games without a display")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = commands.add_parser("record", help="append the snapshot of every turn of the running game to a file")
+    record_parser.add_argument("path")
+    record_parser.add_argument("--turns", type=int, help="stop after this many turns, instead of when the game exits or on Ctrl-C")
+
+    export_parser = commands.add_parser("export", help="render a recorded game to PNG files or raw RGB frames")
+    export_parser.add_argument("path")
+    export_parser.add_argument("--output-dir", help="directory of the PNG frames; raw RGB frames are written to stdout otherwise")
+    export_parser.add_argument("--workers", type=int, help="number of rendering processes, all cores by default")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        try :
+            print(f"{record(args.path, args.turns)} turns recorded", file=sys.stderr)
+        except FileNotFoundError:
+            sys.exit("No game is running")
+    else:
+        started = time.perf_counter()
+        frames = export_frames(read_snapshots(args.path), args.output_dir, sys.stdout.buffer, args.workers)
+        print(f"{frames} frames rendered in {time.perf_counter() - started:.1f} s", file=sys.stderr)
@@ -1,7 +1,5 @@
-import json
 import time
 import pygame
-import requests
 
 from tankwar.drawer.target_drawer import TargetDrawer
 from tankwar.logic import colors
@@ -12,123 +10,279 @@ from explosion_drawer import ExplosionDrawer
 from tankwar.logic.missile import Missile
 from missile_drawer import MissileDrawer
 from tankwar.logic.orientation import Orientation
+from tankwar.logic.snapshot_codec import decode_snapshot
+from tankwar.logic.state_channel import StateChannel, reopen
 from tankwar.logic.tank import Tank
 from tank_drawer import TankDrawer
+from text_cache import TextCache
 from tankwar.logic.target import Target
 
 pygame.init()
 
+FRAMES_PER_SECOND = 60
+
+# Sprites moving further than this in one turn were respawned and are not slid across the arena
+MAX_INTERPOLATED_DISTANCE = 2
+
+HUD_COLORS = {
+    "red": (255, 0, 0),
+    "blue": (0, 0, 255),
+    "orange": (255, 165, 0),
+    "black": (64, 64, 64),
+    "purple": (128, 0, 128),
+    "green": (0, 255, 0),
+}
+
+def entities_from_state(json_dict: dict) -> tuple[list[Tank], list[Missile], list[Explosion], list[Target]]:
+    tanks = [Tank(tank["x"], tank["y"], tank["color"], Orientation(tank["orientation"]), Orientation(tank["turret_orientation"]), tank["id"]) for tank in json_dict["tanks"]]
+    missiles = [Missile(missile["x"], missile["y"], Orientation(missile["orientation"]), missile["color"], missile["id"]) for missile in json_dict["missiles"]]
+    explosions = [Explosion(explosion["x"], explosion["y"]) for explosion in json_dict["explosions"]]
+    targets = [Target(target["x"], target["y"], target["color"], target["id"]) for target in json_dict["targets"]]
+    return tanks, missiles, explosions, targets
+
+def hud_lines(turn: int, game_status, players: list[str], tanks: list[Tank], targets: list[Target], scores: dict, height: int) -> list:
+    """
+    The HUD text as (text, color, position) with positions relative to the HUD panel.
+    """
+    lines = [
+        (f"Turn : {turn}", (255, 255, 255), (0, 50)),
+        (f"Status : {game_status}", (255, 255, 255), (0, 75)),
+    ]
+
+    tanks_by_color = {tank.color: tank for tank in tanks}
+    targets_by_color = {target.color: target for target in targets}
+    y0 = 125
+    for color in players:
+        if y0 + 75 > height:
+            break
+        tank = tanks_by_color.get(color)
+        target = targets_by_color.get(color)
+        
+        if tank is not None and target is not None:
+            text_color = HUD_COLORS[colors.base_color(color)]
+            lines.append((f"{color} tank : x : {tank.x}, y : {tank.y}", text_color, (0, y0)))
+            lines.append((f"{color} target: x : {target.x}, y : {target.y}", text_color, (0, y0+25)))
+            lines.append((f"{color} score: {scores[color]}", text_color, (0, y0+50)))
+        
+        y0 += 100
+    return lines
+
+def window_size(arena: Arena, cell_size_in_pixels: int) -> tuple[int, int]:
+    return (arena.cell_per_row * cell_size_in_pixels + 400, max(arena.cell_per_col * cell_size_in_pixels, 1000))
+
 class GameDrawer:
     
     def __init__(self):
-        self.last_draw = pygame.time.get_ticks()
-        self.window = pygame.display.set_mode((1400, 1000))
+        self.clock = pygame.time.Clock()
 
         self.turn = 0
         self.font = pygame.font.Font(None, 36)
+        self.text_cache = TextCache(self.font)
 
         self.arena = Arena()
-        self.arena_drawer = ArenaDrawer()
-
+        self.players = list(colors.PLAYER_ORDER)
         self.explosions = []
-        self.explosion_drawer = ExplosionDrawer()
-
         self.missiles = []
-        self.missile_drawer = MissileDrawer()
-
         self.tanks = [] 
-        self.tank_drawer = TankDrawer()
-
         self.targets = []
-        self.target_drawer = TargetDrawer()
+
+        # Positions at the previous turn, and when the previous and latest turns were reached
+        self.previous_tank_positions = {}
+        self.previous_missile_positions = {}
+        self.turn_timestamps = (None, None)
+
+        # The size of the arena comes from the first state, the window is opened once a game runs
+        self.state_channel = self.wait_for_game()
+        self.state_sequence = None
+        self.read_state()
+
+        cell_size_in_pixels = ArenaDrawer.cell_size_for(self.arena)
+        self.arena_drawer = ArenaDrawer(cell_size_in_pixels)
+        self.explosion_drawer = ExplosionDrawer(cell_size_in_pixels)
+        self.missile_drawer = MissileDrawer(cell_size_in_pixels)
+        self.tank_drawer = TankDrawer(cell_size_in_pixels)
+        self.target_drawer = TargetDrawer(cell_size_in_pixels)
+
+        self.hud_x = self.arena.cell_per_row * cell_size_in_pixels + 50
+        self.window = pygame.display.set_mode(window_size(self.arena, cell_size_in_pixels))
+
+        # What is currently on screen, to only redraw what changed
+        self.background = None
+        self.scene = None
+        self.drawn_cells = {}
+        self.drawn_moving_sprites = []
+        self.drawn_hud = None
+        # The HUD as drawn for drawn_hud, blitted in one call
+        self.hud_panel = None
 
     def run(self):
         while True:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
+                    print("Text cache:", self.text_cache.stats)
                     pygame.quit()
                     exit()
-            if pygame.time.get_ticks() - self.last_draw > 250:
-                self.read_state()
-                self.draw()
-                self.last_draw = pygame.time.get_ticks()
-            time.sleep(0.01)
+            # Reading the channel is cheap when no new turn was published
+            self.read_state()
+            self.draw()
+            self.clock.tick(FRAMES_PER_SECOND)
+
+    def wait_for_game(self, poll_interval: float = 0.5) -> StateChannel:
+        waiting = False
+        while True:
+            try :
+                return reopen(None)
+            except FileNotFoundError:
+                if not waiting:
+                    print("Waiting for a game to start...")
+                    waiting = True
+                time.sleep(poll_interval)
 
     def read_state(self):
-        
-        r = requests.get("http://127.0.0.1:5000/status")
-        json_str = r.content.decode("utf-8")
         try :
-            json_dict = json.loads(json_str)
-        except json.JSONDecodeError:
-            print("Error decoding JSON:", json_str)
+            channel = reopen(self.state_channel)
+            if channel is not self.state_channel:
+                self.state_channel = channel
+                self.state_sequence = None
+            sequence = self.state_channel.read_sequence()
+            if sequence == self.state_sequence:
+                return
+            _, content = self.state_channel.read()
+        except FileNotFoundError:
+            # The game exited, the last state stays on screen until it is back
+            return
+        self.state_sequence = sequence
+        try :
+            json_dict = decode_snapshot(content)
+        except ValueError as e:
+            print("Error decoding snapshot:", e)
             return
         self.arena.cell_per_row = json_dict["arena"]["cell_per_row"]
         self.arena.cell_per_col = json_dict["arena"]["cell_per_col"]
-        self.tanks = [Tank(tank["x"], tank["y"], tank["color"], Orientation(tank["orientation"]), Orientation(tank["turret_orientation"])) for tank in json_dict["tanks"]]
-        self.missiles = [Missile(missile["x"], missile["y"], Orientation(missile["orientation"]), missile["color"]) for missile in json_dict["missiles"]]
-        self.explosions = [Explosion(explosion["x"], explosion["y"]) for explosion in json_dict["explosions"]]
-        self.targets = [Target(target["x"], target["y"], target["color"]) for target in json_dict["targets"]]
+        self.players = json_dict["players"]
+        if json_dict["turn"] != self.turn:
+            self.previous_tank_positions = {tank.color: (tank.x, tank.y) for tank in self.tanks}
+            self.previous_missile_positions = {missile.id: (missile.x, missile.y) for missile in self.missiles}
+            self.turn_timestamps = (self.turn_timestamps[1], json_dict["timestamp"])
+        if json_dict["turn"] < self.turn:
+            # The game was reset
+            self.previous_tank_positions = {}
+            self.previous_missile_positions = {}
+            self.turn_timestamps = (None, json_dict["timestamp"])
+        self.tanks, self.missiles, self.explosions, self.targets = entities_from_state(json_dict)
         self.turn = json_dict["turn"]
         self.scores = json_dict["scores"]
         self.game_status = json_dict["status"]
         
-    def draw(self):
-        self.window.fill((0, 0, 0))
-        self.arena_drawer.draw(self.arena, self.window)
+    def cell_sprites(self) -> dict:
+        """
+        What has to be drawn on every cell occupied by a target or an explosion,
+        in drawing order, as (key, drawer, entity) where the key tells whether
+        the cell looks the same.
+        """
+        sprites = {}
         for target in self.targets:
-            self.target_drawer.draw(self.window, self.arena_drawer, target)
+            sprites.setdefault((target.x, target.y), []).append((("target", target.color), self.target_drawer, target))
+        for explosion in self.explosions:
+            sprites.setdefault((explosion.x, explosion.y), []).append((("explosion",), self.explosion_drawer, explosion))
+        return sprites
+
+    def interpolation_ratio(self) -> float:
+        """
+        How far the display is between the previous and the latest turn. The
+        display runs one turn behind the game so that it always has both ends.
+        """
+        previous, latest = self.turn_timestamps
+        if previous is None or latest <= previous:
+            return 1.
+        return min(1., max(0., (time.time() - latest) / (latest - previous)))
+
+    def interpolate(self, previous_position, x: int, y: int, ratio: float) -> tuple[int, int]:
+        if previous_position is not None and abs(x - previous_position[0]) + abs(y - previous_position[1]) <= MAX_INTERPOLATED_DISTANCE:
+            x = previous_position[0] + (x - previous_position[0]) * ratio
+            y = previous_position[1] + (y - previous_position[1]) * ratio
+        cell_size_in_pixels = self.arena_drawer.cell_size_in_pixels
+        return (round(x * cell_size_in_pixels), round(y * cell_size_in_pixels))
+
+    def moving_sprites(self) -> list:
+        """
+        Tanks and missiles at their interpolated pixel position, in drawing
+        order, as (key, drawer, entity, position).
+        """
+        ratio = self.interpolation_ratio()
+        sprites = []
         for tank in self.tanks:
-            self.tank_drawer.draw(self.window, self.arena_drawer, tank)
+            position = self.interpolate(self.previous_tank_positions.get(tank.color), tank.x, tank.y, ratio)
+            sprites.append((("tank", tank.color, tank.orientation, tank.turret_orientation, position), self.tank_drawer, tank, position))
         for missile in self.missiles:
-            self.missile_drawer.draw(self.window, self.arena_drawer, missile)
-        for explosion in self.explosions:
-            self.explosion_drawer.draw(self.window, self.arena_drawer, explosion)
-        
-        turn_surface = self.font.render(f"Turn : {self.turn}", True, (255,255,255))
-        turn_rect = turn_surface.get_rect()
-        turn_rect.topleft = (1050, 50) 
-        self.window.blit(turn_surface, turn_rect)
-
-        status_surface = self.font.render(f"Status : {self.game_status}", True, (255,255,255))
-        status_rect = turn_surface.get_rect()
-        status_rect.topleft = (1050, 75)
-        self.window.blit(status_surface, status_rect)
-
-        y0 = 125
-        colors_dict = {
-            "red": (255, 0, 0),
-            "blue": (0, 0, 255),
-            "orange": (255, 165, 0),
-            "black": (64, 64, 64),
-            "purple": (128, 0, 128),
-            "green": (0, 255, 0),
-        }
-        
-        for color in colors.COLORS:
-            tank = [t for t in self.tanks if t.color == color]
-            target = [t for t in self.targets if t.color == color]
-            
-            if len(tank) > 0 and len(target) > 0:
-                tank = tank[0]
-                target = target[0]
-                tank_surface = self.font.render(f"{color} tank : x : {tank.x}, y : {tank.y}", True, colors_dict[color])
-                tank_rect = tank_surface.get_rect()
-                tank_rect.topleft = (1050, y0)  
-                self.window.blit(tank_surface, tank_rect) 
-                
-                target_surface = self.font.render(f"{color} target: x : {target.x}, y : {target.y}", True, colors_dict[color])
-                target_rect = target_surface.get_rect()
-                target_rect.topleft = (1050, y0+25)
-                self.window.blit(target_surface, target_rect) 
-                
-                score_surface = self.font.render(f"{color} score: {self.scores[color]}", True, colors_dict[color])
-                score_rect = score_surface.get_rect()
-                score_rect.topleft = (1050, y0+50)
-                self.window.blit(score_surface, score_rect) 
-            
-            y0 += 100
-        pygame.display.flip()
+            position = self.interpolate(self.previous_missile_positions.get(missile.id), missile.x, missile.y, ratio)
+            sprites.append((("missile", missile.color, missile.orientation, position), self.missile_drawer, missile, position))
+        return sprites
+
+    def sprite_rect(self, position: tuple[int, int]) -> pygame.Rect:
+        return pygame.Rect(position, (self.arena_drawer.cell_size_in_pixels, self.arena_drawer.cell_size_in_pixels))
+
+    def draw(self):
+        first_frame = self.background is None
+        if first_frame:
+            # The grid never changes: render it once and restore cells from it
+            self.background = self.arena_drawer.render(self.arena, self.window.get_size())
+            self.window.blit(self.background, (0, 0))
+            # Background with the targets and explosions, which stay on their cell
+            self.scene = self.background.copy()
+
+        dirty_rects = []
+        sprites_per_cell = self.cell_sprites()
+        keys_per_cell = {cell: tuple(key for key, _, _ in sprites) for cell, sprites in sprites_per_cell.items()}
+        for cell in keys_per_cell.keys() | self.drawn_cells.keys():
+            if keys_per_cell.get(cell) == self.drawn_cells.get(cell):
+                continue
+            rect = self.arena_drawer.cell_rect(*cell)
+            self.scene.blit(self.background, rect, rect)
+            for _, drawer, entity in sprites_per_cell.get(cell, []):
+                drawer.draw(self.scene, self.arena_drawer, entity)
+            dirty_rects.append(rect)
+        self.drawn_cells = keys_per_cell
+
+        moving_sprites = self.moving_sprites()
+        moving_keys = [key for key, _, _, _ in moving_sprites]
+        for key in set(moving_keys).symmetric_difference(self.drawn_moving_sprites):
+            dirty_rects.append(self.sprite_rect(key[-1]))
+        self.drawn_moving_sprites = moving_keys
+
+        for rect in dirty_rects:
+            self.window.blit(self.scene, rect, rect)
+        # Clipped to the dirty rects, so that the parts of a sprite outside of them do not cover the sprites drawn after it
+        for _, drawer, entity, position in moving_sprites:
+            for index in self.sprite_rect(position).collidelistall(dirty_rects):
+                self.window.set_clip(dirty_rects[index])
+                drawer.draw(self.window, self.arena_drawer, entity, position)
+        self.window.set_clip(None)
+
+        hud_rect = self.draw_hud()
+        if hud_rect is not None:
+            dirty_rects.append(hud_rect)
+
+        if first_frame:
+            pygame.display.flip()
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
+
+    def hud_lines(self) -> list:
+        return hud_lines(self.turn, self.game_status, self.players, self.tanks, self.targets, self.scores, self.window.get_height())
+
+    def draw_hud(self):
+        lines = self.hud_lines()
+        if lines == self.drawn_hud:
+            return None
+        self.drawn_hud = lines
+
+        hud_rect = pygame.Rect(self.hud_x, 0, self.window.get_width() - self.hud_x, self.window.get_height())
+        self.hud_panel = self.background.subsurface(hud_rect).copy()
+        for text, text_color, position in lines:
+            self.hud_panel.blit(self.text_cache.render(text, text_color), position)
+        self.window.blit(self.hud_panel, hud_rect)
+        return hud_rect
 
 if __name__ == '__main__':
     game = GameDrawer().run()
\ No newline at end of file
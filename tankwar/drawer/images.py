@@ -1,3 +1,13 @@
 from importlib.resources import files
 
-IMAGE_PATH = files('tankwar.drawer').joinpath('images')
\ No newline at end of file
+import pygame
+
+IMAGE_PATH = files('tankwar.drawer').joinpath('images')
+
+IMAGE_SIZE = 20
+
+def load_image(filename: str, cell_size: int = IMAGE_SIZE) -> pygame.Surface:
+    image = pygame.image.load(IMAGE_PATH.joinpath(filename))
+    if cell_size != IMAGE_SIZE:
+        image = pygame.transform.scale(image, (cell_size, cell_size))
+    return image
@@ -1,17 +1,17 @@
-from tankwar.logic.colors import COLORS
+from tankwar.logic.colors import COLORS, base_color
 from arena_drawer import ArenaDrawer
 from tankwar.logic.missile import Missile
 from tankwar.logic.orientation import Orientation
-from tankwar.drawer.images import IMAGE_PATH
+from tankwar.drawer.images import load_image
 
 import pygame
 
 class MissileDrawer:
 
-    def __init__(self):
+    def __init__(self, cell_size_in_pixels: int = 20):
         images_per_color = {}
         for color in COLORS:
-            images_per_color[color] = pygame.image.load(IMAGE_PATH.joinpath(f"{color}_missile.png"))
+            images_per_color[color] = load_image(f"{color}_missile.png", cell_size_in_pixels)
 
         self.missile_image_per_color_and_orientation = {}
         for color in COLORS:
@@ -22,5 +22,7 @@ class MissileDrawer:
             self.missile_image_per_color_and_orientation[(color, Orientation.EAST)] = pygame.transform.rotate(missile_image, -90)
             self.missile_image_per_color_and_orientation[(color, Orientation.WEST)] = pygame.transform.rotate(missile_image, +90)
 
-    def draw(self, window, arena_drawer : ArenaDrawer, missile: Missile):
-        window.blit(self.missile_image_per_color_and_orientation[(missile.color, missile.orientation)], (missile.x * arena_drawer.cell_size_in_pixels, missile.y * arena_drawer.cell_size_in_pixels))
\ No newline at end of file
+    def draw(self, window, arena_drawer : ArenaDrawer, missile: Missile, position: tuple[int, int] = None):
+        if position is None:
+            position = (missile.x * arena_drawer.cell_size_in_pixels, missile.y * arena_drawer.cell_size_in_pixels)
+        window.blit(self.missile_image_per_color_and_orientation[(base_color(missile.color), missile.orientation)], position)
\ No newline at end of file
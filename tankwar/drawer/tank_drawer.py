@@ -1,17 +1,17 @@
-from tankwar.logic.colors import COLORS
+from tankwar.logic.colors import COLORS, base_color
 from arena_drawer import ArenaDrawer
 from tankwar.logic.tank import Tank
 from tankwar.logic.orientation import Orientation
-from tankwar.drawer.images import IMAGE_PATH
+from tankwar.drawer.images import load_image
 import pygame
 
 class TankDrawer:
 
-    def __init__(self):
+    def __init__(self, cell_size_in_pixels: int = 20):
         images_per_color, turret_images_per_color = {}, {}
         for color in COLORS:
-            images_per_color[color] = pygame.image.load(IMAGE_PATH.joinpath(f"{color}_tank_body.png"))
-            turret_images_per_color[color] = pygame.image.load(IMAGE_PATH.joinpath(f"{color}_tank_turret.png"))
+            images_per_color[color] = load_image(f"{color}_tank_body.png", cell_size_in_pixels)
+            turret_images_per_color[color] = load_image(f"{color}_tank_turret.png", cell_size_in_pixels)
 
         self.body_image_per_color_and_orientation = {}
         self.turret_image_per_color_and_orientation = {}
@@ -28,6 +28,8 @@ class TankDrawer:
             self.turret_image_per_color_and_orientation[(color, Orientation.EAST)] = pygame.transform.rotate(turret_image, -90)
             self.turret_image_per_color_and_orientation[(color, Orientation.WEST)] = pygame.transform.rotate(turret_image, +90)
 
-    def draw(self, window, arena_drawer : ArenaDrawer, tank: Tank):
-        window.blit(self.body_image_per_color_and_orientation[(tank.color, tank.orientation)], (tank.x * arena_drawer.cell_size_in_pixels, tank.y * arena_drawer.cell_size_in_pixels))
-        window.blit(self.turret_image_per_color_and_orientation[(tank.color, tank.turret_orientation)], (tank.x * arena_drawer.cell_size_in_pixels, tank.y * arena_drawer.cell_size_in_pixels))
\ No newline at end of file
+    def draw(self, window, arena_drawer : ArenaDrawer, tank: Tank, position: tuple[int, int] = None):
+        if position is None:
+            position = (tank.x * arena_drawer.cell_size_in_pixels, tank.y * arena_drawer.cell_size_in_pixels)
+        window.blit(self.body_image_per_color_and_orientation[(base_color(tank.color), tank.orientation)], position)
+        window.blit(self.turret_image_per_color_and_orientation[(base_color(tank.color), tank.turret_orientation)], position)
\ No newline at end of file
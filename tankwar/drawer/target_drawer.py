@@ -1,17 +1,15 @@
-from tankwar.logic.colors import COLORS
+from tankwar.logic.colors import COLORS, base_color
 from arena_drawer import ArenaDrawer
-from tankwar.drawer.images import IMAGE_PATH
-
-import pygame
+from tankwar.drawer.images import load_image
 
 from tankwar.logic.target import Target
 
 class TargetDrawer:
 
-    def __init__(self):
+    def __init__(self, cell_size_in_pixels: int = 20):
         self.images_per_color = {}
         for color in COLORS:
-            self.images_per_color[color] = pygame.image.load(IMAGE_PATH.joinpath(f"{color}_target.png"))
+            self.images_per_color[color] = load_image(f"{color}_target.png", cell_size_in_pixels)
 
     def draw(self, window, arena_drawer : ArenaDrawer, target: Target):
-        window.blit(self.images_per_color[target.color], (target.x * arena_drawer.cell_size_in_pixels, target.y * arena_drawer.cell_size_in_pixels))
\ No newline at end of file
+        window.blit(self.images_per_color[base_color(target.color)], (target.x * arena_drawer.cell_size_in_pixels, target.y * arena_drawer.cell_size_in_pixels))
\ No newline at end of file
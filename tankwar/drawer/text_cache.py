@@ -0,0 +1,37 @@
+from collections import OrderedDict
+
+import pygame
+
+class TextCache:
+    """
+    Least recently used cache of rendered text surfaces, keyed by (text, color).
+    """
+
+    def __init__(self, font: pygame.font.Font, max_size: int = 256):
+        self.font = font
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+        key = (text, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.font.render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    @property
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.surfaces)}
+
+    def __len__(self):
+        return len(self.surfaces)
@@ -0,0 +1,79 @@
+import json
+import threading
+from multiprocessing.connection import Client, Listener
+
+from tankwar.logic.action_table import ActionTable
+
+ACTION_ADDRESS = ("127.0.0.1", 5001)
+ACTION_AUTHKEY = b"tankwar"
+
+class ActionListener:
+    """
+    Receives batches of (color, turn, action) entries from the server and feeds
+    them to the game's action table.
+
+    Batches are sent as JSON rather than pickled: anything able to reach the
+    port could otherwise run code in the game when the batch is unpickled.
+    """
+
+    def __init__(self, action_table: ActionTable, address=ACTION_ADDRESS):
+        self.action_table = action_table
+        self.listener = Listener(address, authkey=ACTION_AUTHKEY)
+        self.thread = threading.Thread(target=self.accept, daemon=True)
+        self.thread.start()
+
+    def accept(self):
+        while True:
+            try:
+                connection = self.listener.accept()
+            except OSError:
+                return
+            threading.Thread(target=self.receive, args=(connection,), daemon=True).start()
+
+    def receive(self, connection):
+        with connection:
+            while True:
+                try:
+                    entries = json.loads(connection.recv_bytes())
+                except (EOFError, OSError):
+                    return
+                except ValueError:
+                    print("Ignoring a malformed action batch")
+                    continue
+                if not isinstance(entries, list):
+                    print("Ignoring a malformed action batch")
+                    continue
+                for entry in entries:
+                    if is_valid_entry(entry):
+                        self.action_table.submit(*entry)
+
+    def close(self):
+        self.listener.close()
+
+def is_valid_entry(entry) -> bool:
+    if not isinstance(entry, list) or len(entry) != 3:
+        return False
+    color, turn, action = entry
+    return isinstance(color, str) and type(turn) is int and isinstance(action, str)
+
+class ActionSender:
+
+    def __init__(self, address=ACTION_ADDRESS):
+        self.address = address
+        self.lock = threading.Lock()
+        self.connection = None
+
+    def send(self, color: str, turn: int, action: str):
+        self.send_many([(color, turn, action)])
+
+    def send_many(self, entries: list[tuple[str, int, str]]):
+        with self.lock:
+            batch = json.dumps(entries).encode()
+            if self.connection is None:
+                self.connection = Client(self.address, authkey=ACTION_AUTHKEY)
+            try:
+                self.connection.send_bytes(batch)
+            except OSError:
+                # The game was restarted, reconnect once
+                self.connection = Client(self.address, authkey=ACTION_AUTHKEY)
+                self.connection.send_bytes(batch)
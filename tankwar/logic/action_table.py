@@ -0,0 +1,43 @@
+import threading
+
+class ActionTable:
+    """
+    Actions submitted for the current and previous turns, keyed by (color, turn).
+
+    Submissions for turns outside of the window are dropped, so the table never
+    holds more than max_pending_turns turns and discarding the stale ones is O(1).
+    """
+
+    def __init__(self, max_pending_turns: int = 2):
+        self.lock = threading.Lock()
+        self.max_pending_turns = max_pending_turns
+        self.actions_per_turn: dict[int, dict[str, str]] = {}
+        self.first_turn = 0
+
+    def submit(self, color: str, turn: int, action: str) -> bool:
+        with self.lock:
+            if turn < self.first_turn or turn >= self.first_turn + self.max_pending_turns:
+                return False
+            self.actions_per_turn.setdefault(turn, {})[color] = action
+            return True
+
+    def get(self, color: str, turn: int):
+        with self.lock:
+            actions = self.actions_per_turn.get(turn)
+            if actions is None:
+                return None
+            return actions.get(color)
+
+    def discard_before(self, turn: int):
+        with self.lock:
+            if turn - self.first_turn > self.max_pending_turns:
+                self.actions_per_turn.clear()
+            else:
+                for stale_turn in range(self.first_turn, turn):
+                    self.actions_per_turn.pop(stale_turn, None)
+            self.first_turn = max(self.first_turn, turn)
+
+    def clear(self):
+        with self.lock:
+            self.actions_per_turn.clear()
+            self.first_turn = 0
@@ -1,4 +1,18 @@
+from tankwar.logic.free_cell_index import FreeCellIndex
+from tankwar.logic.occupancy_index import OccupancyIndex
+
 class Arena:
-    def __init__(self):
-        self.cell_per_row = 50
-        self.cell_per_col = 50
+    def __init__(self, cell_per_row: int = 50, cell_per_col: int = 50, free_cells: FreeCellIndex = None):
+        self.cell_per_row = cell_per_row
+        self.cell_per_col = cell_per_col
+
+        # Kept up to date by the tank and target indexes when given
+        self.free_cells = free_cells
+        self.tank_index = OccupancyIndex(free_cells)
+        self.missile_index = OccupancyIndex()
+        self.target_index = OccupancyIndex(free_cells)
+
+    def index(self, tanks, missiles, targets):
+        self.tank_index.rebuild(tanks)
+        self.missile_index.rebuild(missiles)
+        self.target_index.rebuild(targets)
@@ -0,0 +1,123 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Optional, Protocol
+
+from tankwar.logic.orientation import Orientation
+from tankwar.logic.tank import Action, Tank
+
+class OtherTanks(Sequence):
+    """
+    Read-only view of the (x, y) of every tank but one, over the positions of
+    all the tanks. The observations of a turn share the same positions, so
+    observing every tank stays linear in the number of tanks.
+    """
+
+    __slots__ = ("positions", "index")
+
+    def __init__(self, positions: tuple[tuple[int, int], ...], index: int):
+        self.positions = positions
+        self.index = index
+
+    def __len__(self):
+        return len(self.positions) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return tuple(self)[i]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("other tank index out of range")
+        return self.positions[i + 1 if i >= self.index else i]
+
+    def __iter__(self):
+        yield from self.positions[:self.index]
+        yield from self.positions[self.index + 1:]
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return tuple(self) == tuple(other)
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        return repr(tuple(self))
+
+@dataclass(frozen=True)
+class Observation:
+    """
+    What a bot knows when it decides the action of its tank for a turn.
+    """
+    turn: int
+    color: str
+    x: int
+    y: int
+    orientation: Orientation
+    turret_orientation: Orientation
+    target_x: Optional[int]
+    target_y: Optional[int]
+    score: int
+    cell_per_row: int
+    cell_per_col: int
+    # (x, y) of every other tank
+    other_tanks: Sequence[tuple[int, int]] = ()
+
+    @classmethod
+    def of(cls, game: "Game", tank: Tank, other_tanks: OtherTanks = None) -> "Observation":
+        """
+        The observation of a tank. When observing every tank of a turn, pass
+        views over positions built once for the turn, see Game.decide_bots.
+        """
+        if other_tanks is None:
+            other_tanks = OtherTanks(tuple((other.x, other.y) for other in game.tanks), game.tanks.index(tank))
+        target = game.registry.first_of_color("targets", tank.color)
+        return cls(
+            turn=game.turn,
+            color=tank.color,
+            x=tank.x,
+            y=tank.y,
+            orientation=tank.orientation,
+            turret_orientation=tank.turret_orientation,
+            target_x=target.x if target is not None else None,
+            target_y=target.y if target is not None else None,
+            score=game.scores.get(tank.color, 0),
+            cell_per_row=game.arena.cell_per_row,
+            cell_per_col=game.arena.cell_per_col,
+            other_tanks=other_tanks,
+        )
+
+    @classmethod
+    def from_state(cls, state: dict, color: str) -> Optional["Observation"]:
+        """
+        The observation of a player from the JSON state served by GET /status,
+        or None when its tank is not in the game.
+        """
+        tank = next((tank for tank in state["tanks"] if tank["color"] == color), None)
+        if tank is None:
+            return None
+        target = next((target for target in state["targets"] if target["color"] == color), None)
+        return cls(
+            turn=state["turn"],
+            color=color,
+            x=tank["x"],
+            y=tank["y"],
+            orientation=Orientation(tank["orientation"]),
+            turret_orientation=Orientation(tank["turret_orientation"]),
+            target_x=target["x"] if target is not None else None,
+            target_y=target["y"] if target is not None else None,
+            score=state["scores"].get(color, 0),
+            cell_per_row=state["arena"]["cell_per_row"],
+            cell_per_col=state["arena"]["cell_per_col"],
+            other_tanks=tuple((other["x"], other["y"]) for other in state["tanks"] if other["color"] != color),
+        )
+
+class Bot(Protocol):
+    """
+    A player the game calls in-process every turn. Returning None keeps the
+    tank idle for the turn.
+    """
+
+    def decide(self, observation: Observation) -> Optional[Action]:
+        ...
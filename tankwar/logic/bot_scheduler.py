@@ -0,0 +1,61 @@
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+from tankwar.logic.bot import Bot, Observation
+from tankwar.logic.tank import Action
+
+class BotScheduler:
+    """
+    Runs the decisions of several players concurrently and gives up on the
+    ones that are not done at the deadline, so one slow player cannot hold up
+    the turn of the others.
+
+    Late decisions are dropped and counted. A player still busy with an earlier
+    turn is not called again until it is done, and that turn counts as late too.
+
+    Threads suit players waiting on I/O. With use_processes, CPU heavy bots run
+    in a process pool instead, but every call works on a pickled copy of the
+    bot, so such bots must not rely on state kept between turns.
+    """
+
+    def __init__(self, deadline: float = 0.5, use_processes: bool = False, workers: int = None):
+        self.deadline = deadline
+        self.executor = ProcessPoolExecutor(workers) if use_processes else ThreadPoolExecutor(workers or 32)
+        self.running = {}
+        self.late = defaultdict(int)
+        self.failed = defaultdict(int)
+
+    def run(self, calls: dict) -> dict:
+        """
+        Call every function of calls, a dict of key: (function, args), and
+        return the results of the calls done before the deadline by key.
+        """
+        futures = {}
+        for key, (function, args) in calls.items():
+            previous = self.running.get(key)
+            if previous is not None and not previous.done():
+                self.late[key] += 1
+                continue
+            futures[key] = self.executor.submit(function, *args)
+        done, _ = wait(futures.values(), timeout=self.deadline)
+
+        results = {}
+        for key, future in futures.items():
+            if future not in done:
+                self.late[key] += 1
+                self.running[key] = future
+                print(f"{key} missed the {self.deadline} s deadline, {self.late[key]} late decisions so far")
+                continue
+            self.running.pop(key, None)
+            try :
+                results[key] = future.result()
+            except Exception as e:
+                self.failed[key] += 1
+                print(f"Error in {key}: {e}")
+        return results
+
+    def decide(self, bots: dict[str, Bot], observations: dict[str, Observation]) -> dict[str, Action]:
+        return self.run({color: (bots[color].decide, (observation,)) for color, observation in observations.items()})
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
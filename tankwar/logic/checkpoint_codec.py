@@ -0,0 +1,113 @@
+import json
+import struct
+from array import array
+
+from tankwar.logic.entity_registry import SLOT_MASK, EntityRegistry
+from tankwar.logic.explosion import Explosion
+from tankwar.logic.free_cell_index import FreeCellIndex
+from tankwar.logic.missile import Missile
+from tankwar.logic.orientation import Orientation
+from tankwar.logic.tank import Action, Tank
+from tankwar.logic.target import Target
+
+CHECKPOINT_VERSION = 1
+
+# version, length of the JSON part, number of cells of the free cell index
+HEADER = struct.Struct("<BII")
+
+def encode_checkpoint(checkpoint: dict) -> bytes:
+    """
+    Write a Game.checkpoint() as plain data: a JSON document with the fields
+    of every entity, the registry slots and generations, the scores and the
+    state of the random generator, followed by the order of the cells of the
+    free cell index as little endian integers.
+
+    Nothing is pickled, so loading a checkpoint never runs code, and the
+    format does not change with the entity classes.
+    """
+    registry = checkpoint["registry"]
+    free_cells = checkpoint["free_cells"]
+    version, state, gauss_next = checkpoint["random"]
+    document = {
+        "turn": checkpoint["turn"],
+        "scores": checkpoint["scores"],
+        "random": [version, list(state), gauss_next],
+        "next_missile_id": checkpoint["next_missile_id"],
+        "tanks": [
+            [tank.id, tank.x, tank.y, tank.color, tank.orientation.value, tank.turret_orientation.value, tank.next_action.value if tank.next_action is not None else 0]
+            for tank in registry.tanks
+        ],
+        "missiles": [[missile.id, missile.x, missile.y, missile.color, missile.orientation.value] for missile in registry.missiles],
+        "targets": [[target.id, target.x, target.y, target.color] for target in registry.targets],
+        "array_missiles": [[missile.id, missile.x, missile.y, missile.color, missile.orientation.value] for missile in checkpoint["missiles"]],
+        "explosions": [[explosion.x, explosion.y] for explosion in checkpoint["explosions"]],
+        "generations": list(registry.generations),
+        "free_slots": list(registry.free_slots),
+        # The ids of every color in the order of the index, which decides the first entity of a color
+        "colors": {kind: [[color, list(entities)] for color, entities in colors.items()] for kind, colors in registry.colors.items()},
+        "free_cells": {
+            "cell_per_row": free_cells.cell_per_row,
+            "cell_per_col": free_cells.cell_per_col,
+            "free_count": free_cells.free_count,
+            "occupants": list(free_cells.occupants.items()),
+        },
+    }
+    content = json.dumps(document).encode("utf-8")
+    cells = free_cells.cells
+    return HEADER.pack(CHECKPOINT_VERSION, len(content), len(cells)) + content + struct.pack(f"<{len(cells)}I", *cells)
+
+def checkpoint_version(data: bytes) -> int:
+    return data[0]
+
+def decode_checkpoint(data: bytes) -> dict:
+    """
+    Rebuild the dict of Game.checkpoint() from encode_checkpoint() data, with new entities.
+    """
+    version, length, cell_count = HEADER.unpack_from(data, 0)
+    if version != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version {version}, expected {CHECKPOINT_VERSION}")
+    document = json.loads(data[HEADER.size:HEADER.size + length])
+
+    registry = EntityRegistry()
+    registry.generations = document["generations"]
+    registry.free_slots = document["free_slots"]
+    registry.entities = [None] * len(registry.generations)
+    registry.positions = [0] * len(registry.generations)
+    tanks = [
+        Tank(x, y, color, Orientation(orientation), Orientation(turret_orientation), tank_id)
+        for tank_id, x, y, color, orientation, turret_orientation, _ in document["tanks"]
+    ]
+    for tank, (*_, action) in zip(tanks, document["tanks"]):
+        tank.next_action = Action(action) if action else None
+    missiles = [Missile(x, y, Orientation(orientation), color, missile_id) for missile_id, x, y, color, orientation in document["missiles"]]
+    targets = [Target(x, y, color, target_id) for target_id, x, y, color in document["targets"]]
+    for kind, entities in (("tanks", tanks), ("missiles", missiles), ("targets", targets)):
+        registry.lists[kind].extend(entities)
+        for position, entity in enumerate(entities):
+            slot = entity.id & SLOT_MASK
+            registry.entities[slot] = entity
+            registry.positions[slot] = position
+    registry.colors = {
+        kind: {color: {entity_id: registry.get(entity_id) for entity_id in entity_ids} for color, entity_ids in colors}
+        for kind, colors in document["colors"].items()
+    }
+
+    free_cells_document = document["free_cells"]
+    free_cells = FreeCellIndex(free_cells_document["cell_per_row"], free_cells_document["cell_per_col"])
+    free_cells.cells = array("I", struct.unpack_from(f"<{cell_count}I", data, HEADER.size + length))
+    for position, cell in enumerate(free_cells.cells):
+        free_cells.positions[cell] = position
+    free_cells.free_count = free_cells_document["free_count"]
+    free_cells.occupants = {cell: count for cell, count in free_cells_document["occupants"]}
+
+    version, state, gauss_next = document["random"]
+    return {
+        "turn": document["turn"],
+        "registry": registry,
+        "missiles": [Missile(x, y, Orientation(orientation), color, missile_id) for missile_id, x, y, color, orientation in document["array_missiles"]],
+        "explosions": [Explosion(x, y) for x, y in document["explosions"]],
+        "scores": document["scores"],
+        "random": (version, tuple(state), gauss_next),
+        "free_cells": free_cells,
+        "next_missile_id": document["next_missile_id"],
+    }
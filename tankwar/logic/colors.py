@@ -1 +1,18 @@
-COLORS = ["red", "green", "blue", "orange", "black", "purple"]
\ No newline at end of file
+COLORS = ["red", "green", "blue", "orange", "black", "purple"]
+
+# Order in which players join a game, it decides their spawn position
+PLAYER_ORDER = ["green", "red", "blue", "orange", "black", "purple"]
+
+def player_names(count: int) -> list[str]:
+    """
+    Name count players after the six colors, adding a suffix once the colors
+    run out: green, red, ..., purple, green_1, red_1, ...
+    """
+    names = []
+    for i in range(count):
+        color = PLAYER_ORDER[i % len(PLAYER_ORDER)]
+        names.append(color if i < len(PLAYER_ORDER) else f"{color}_{i // len(PLAYER_ORDER)}")
+    return names
+
+def base_color(player: str) -> str:
+    return player.split("_")[0]
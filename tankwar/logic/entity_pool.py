@@ -0,0 +1,34 @@
+class EntityPool:
+    """
+    Free list of entities of one class, reused instead of allocated every turn.
+
+    acquire() runs __init__ again on a released entity, so an entity must not be
+    used anywhere once released. The free list is bounded so that a burst of
+    entities does not stay allocated for the rest of the game.
+    """
+
+    def __init__(self, entity_class: type, max_free: int = 4096):
+        self.entity_class = entity_class
+        self.max_free = max_free
+        self.free = []
+        self.allocated = 0
+        self.reused = 0
+
+    def acquire(self, *args):
+        if self.free:
+            entity = self.free.pop()
+            entity.__init__(*args)
+            self.reused += 1
+            return entity
+        self.allocated += 1
+        return self.entity_class(*args)
+
+    def release(self, entity):
+        if len(self.free) < self.max_free:
+            self.free.append(entity)
+
+    def release_all(self, entities):
+        for entity in entities:
+            if len(self.free) >= self.max_free:
+                return
+            self.free.append(entity)
@@ -0,0 +1,114 @@
+from tankwar.logic.missile import Missile
+from tankwar.logic.tank import Tank
+from tankwar.logic.target import Target
+
+SLOT_BITS = 32
+SLOT_MASK = (1 << SLOT_BITS) - 1
+
+KINDS = {Tank: "tanks", Missile: "missiles", Target: "targets"}
+
+class EntityRegistry:
+    """
+    Tanks, missiles and targets of a game, by generational id.
+
+    An id is the slot of the entity in the registry and the generation of that
+    slot: a removed entity frees its slot for the next entity, with the next
+    generation, so a stale id never finds the entity reusing its slot.
+
+    Every kind is kept in a dense list, shared with the rest of the game as
+    game.tanks, game.missiles and game.targets. Removing an entity moves the
+    last one of its list into its place, so removal is O(1) and the lists are
+    not ordered. Entities are also indexed by kind and color.
+    """
+
+    def __init__(self):
+        self.tanks = []
+        self.missiles = []
+        self.targets = []
+        self.reset()
+
+    def reset(self):
+        """
+        Remove every entity and start the ids over, for a new match.
+        """
+        self.lists = {"tanks": self.tanks, "missiles": self.missiles, "targets": self.targets}
+        for entities in self.lists.values():
+            entities.clear()
+        # Per slot: the entity, its generation and its position in the list of its kind
+        self.entities = []
+        self.generations = []
+        self.positions = []
+        self.free_slots = []
+        self.colors = {kind: {} for kind in self.lists}
+
+    def add(self, entity) -> int:
+        if self.free_slots:
+            slot = self.free_slots.pop()
+            self.entities[slot] = entity
+        else:
+            slot = len(self.entities)
+            self.entities.append(entity)
+            self.generations.append(0)
+            self.positions.append(0)
+        kind = KINDS[type(entity)]
+        entity.id = self.generations[slot] << SLOT_BITS | slot
+        entities = self.lists[kind]
+        self.positions[slot] = len(entities)
+        entities.append(entity)
+        self.colors[kind].setdefault(entity.color, {})[entity.id] = entity
+        return entity.id
+
+    def remove(self, entity):
+        slot = entity.id & SLOT_MASK
+        if slot >= len(self.entities) or self.entities[slot] is not entity:
+            raise KeyError(f"{type(entity).__name__} {entity.id} is not in the registry")
+        kind = KINDS[type(entity)]
+        entities = self.lists[kind]
+        last = entities.pop()
+        if last is not entity:
+            position = self.positions[slot]
+            entities[position] = last
+            self.positions[last.id & SLOT_MASK] = position
+        of_color = self.colors[kind][entity.color]
+        del of_color[entity.id]
+        if not of_color:
+            del self.colors[kind][entity.color]
+        self.entities[slot] = None
+        self.generations[slot] += 1
+        self.free_slots.append(slot)
+
+    def remove_all(self, entities):
+        # By id, so that the slots are freed in the same order when a match is replayed
+        for entity in sorted(entities, key=lambda entity: entity.id):
+            self.remove(entity)
+
+    def clear(self, kind: str):
+        self.remove_all(list(self.lists[kind]))
+
+    def get(self, entity_id: int):
+        slot = entity_id & SLOT_MASK
+        if slot >= len(self.entities):
+            return None
+        entity = self.entities[slot]
+        if entity is None or entity.id != entity_id:
+            return None
+        return entity
+
+    def of_color(self, kind: str, color: str) -> list:
+        return list(self.colors[kind].get(color, {}).values())
+
+    def first_of_color(self, kind: str, color: str):
+        return next(iter(self.colors[kind].get(color, {}).values()), None)
+
+    def restore(self, other: "EntityRegistry"):
+        """
+        Take the entities and ids of another registry, such as a checkpoint,
+        keeping the lists shared with the game.
+        """
+        for kind, entities in self.lists.items():
+            entities[:] = other.lists[kind]
+        self.entities = other.entities
+        self.generations = other.generations
+        self.positions = other.positions
+        self.free_slots = other.free_slots
+        self.colors = other.colors
@@ -1,4 +1,7 @@
 class Explosion:
+
+    __slots__ = ("x", "y")
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -0,0 +1,75 @@
+import random
+from array import array
+
+class FreeCellIndex:
+    """
+    Cells with neither a tank nor a target, sampled uniformly in O(1).
+
+    Every cell of the arena is kept in one array, the free cells first, along
+    with the position of every cell in it. A cell that gets occupied swaps
+    with the last free cell and the free part shrinks by one, a cell that gets
+    free swaps with the first occupied cell, so updates are O(1) too.
+
+    The tank and target occupancy indexes of the arena report the cells they
+    start and stop occupying, a cell being free when neither occupies it.
+    """
+
+    def __init__(self, cell_per_row: int, cell_per_col: int):
+        self.cell_per_row = cell_per_row
+        self.cell_per_col = cell_per_col
+        self.reset()
+
+    def reset(self):
+        """
+        Free every cell, in the order of a new index.
+        """
+        self.cells = array("I", range(self.cell_per_row * self.cell_per_col))
+        self.positions = array("I", range(self.cell_per_row * self.cell_per_col))
+        self.free_count = len(self.cells)
+        # Number of indexes occupying every occupied cell
+        self.occupants: dict[int, int] = {}
+
+    def __len__(self):
+        return self.free_count
+
+    def is_free(self, x: int, y: int) -> bool:
+        return y * self.cell_per_row + x not in self.occupants
+
+    def occupy(self, x: int, y: int):
+        cell = y * self.cell_per_row + x
+        count = self.occupants.get(cell, 0)
+        self.occupants[cell] = count + 1
+        if count == 0:
+            self.free_count -= 1
+            self.swap(self.positions[cell], self.free_count)
+
+    def vacate(self, x: int, y: int):
+        cell = y * self.cell_per_row + x
+        count = self.occupants[cell] - 1
+        if count > 0:
+            self.occupants[cell] = count
+            return
+        del self.occupants[cell]
+        self.swap(self.positions[cell], self.free_count)
+        self.free_count += 1
+
+    def swap(self, i: int, j: int):
+        cell_i, cell_j = self.cells[i], self.cells[j]
+        self.cells[i], self.cells[j] = cell_j, cell_i
+        self.positions[cell_i], self.positions[cell_j] = j, i
+
+    def sample(self, rng: random.Random) -> tuple[int, int] | None:
+        if self.free_count == 0:
+            return None
+        cell = self.cells[rng.randrange(self.free_count)]
+        return cell % self.cell_per_row, cell // self.cell_per_row
+
+    def restore(self, other: "FreeCellIndex"):
+        """
+        Take the order of the cells of another index, such as a checkpoint:
+        the cell drawn for a random number depends on it.
+        """
+        self.cells = array("I", other.cells)
+        self.positions = array("I", other.positions)
+        self.free_count = other.free_count
+        self.occupants = dict(other.occupants)
@@ -1,78 +1,146 @@
+import random
 
-import time
+from tankwar.logic.action_listener import ActionListener
+from tankwar.logic.action_table import ActionTable
 from tankwar.logic.arena import Arena
+from tankwar.logic.bot import Bot, Observation, OtherTanks
+from tankwar.logic.bot_scheduler import BotScheduler
+from tankwar.logic.colors import player_names
+from tankwar.logic.entity_pool import EntityPool
+from tankwar.logic.entity_registry import EntityRegistry
+from tankwar.logic.explosion import Explosion
+from tankwar.logic.free_cell_index import FreeCellIndex
 from tankwar.logic.game_cleaner import GameCleaner
+from tankwar.logic.game_config import GameConfig
+from tankwar.logic.game_pacer import FastForwardPacer, RealTimePacer
 from tankwar.logic.game_runner import GameRunner
 from tankwar.logic.game_writer import GameWriter
+from tankwar.logic.match_recorder import MatchRecorder
+from tankwar.logic.metrics_writer import MetricsWriter
+from tankwar.logic.missile import Missile
+from tankwar.logic.missile_array import MissileArray
+from tankwar.logic.missile_array_collider import MissileArrayCollider
 from tankwar.logic.missile_collider import MissileCollider
 from tankwar.logic.missile_updater import MissileUpdater
+from tankwar.logic.spawn_placer import SPAWN_POLICIES, SpawnPlacer
 from tankwar.logic.tank import Tank
 from tankwar.logic.tank_actioner import TankActioner
 from tankwar.logic.tank_updater import TankUpdater
+from tankwar.logic.turn_metrics import TurnMetrics
 from tankwar.logic.target import Target
 from tankwar.logic.target_collider import TargetCollider
 
 class Game:
     
-    def __init__(self):
-        self.last_update = time.time()
+    def __init__(self, config: GameConfig = None, headless: bool = False, metrics_interval: float = 10.):
+        self.config = config or GameConfig()
+        self.headless = headless
+        self.pacer = FastForwardPacer() if headless else RealTimePacer()
 
-        self.arena = Arena()
+        # Every random draw of the game comes from this generator, so that a seed and the actions replay a match
+        self.seed = self.config.seed if self.config.seed is not None else random.randrange(2**32)
+        self.random = random.Random(self.seed)
+
+        # Cells without a tank or a target, where tanks spawn and targets respawn
+        self.free_cells = FreeCellIndex(self.config.cell_per_row, self.config.cell_per_col)
+        self.arena = Arena(self.config.cell_per_row, self.config.cell_per_col, self.free_cells)
+        self.spawn_placer = SpawnPlacer(self.free_cells, self.random, self.config.target_spawn_policy)
 
         self.explosions = []
 
-        self.missiles = []
+        # Tanks, missiles and targets by id, the lists below belong to it
+        self.registry = EntityRegistry()
+        self.missiles = MissileArray() if self.config.vectorized_missiles else self.registry.missiles
+        # Destroyed missiles and past explosions are reused, across turns and resets
+        self.missile_pool = EntityPool(Missile)
+        self.explosion_pool = EntityPool(Explosion)
         self.missile_updater = MissileUpdater(self.arena)
 
-        self.tanks = [] 
-        self.tanks.append(Tank(5, 5, "green"))
-        self.tanks.append(Tank(13, 13, "red"))
-        self.tanks.append(Tank(21, 21, "blue"))
-        self.tanks.append(Tank(29, 29, "orange"))
-        self.tanks.append(Tank(37, 37, "black"))
-        self.tanks.append(Tank(45, 45, "purple"))
-
+        self.tanks = self.registry.tanks
+        self.targets = self.registry.targets
+        self.scores = {}
+        self.spawn()
 
-        self.tank_actioner = TankActioner()
+        self.action_table = ActionTable()
+        self.tank_actioner = TankActioner(self.action_table)
+        self.action_listener = None
 
-        self.missile_collider = MissileCollider(self.missiles, self.tanks, self.explosions)
+        if self.config.vectorized_missiles:
+            self.missile_collider = MissileArrayCollider(self.arena, self.missiles, self.tanks, self.explosions, self.registry, self.explosion_pool)
+        else:
+            self.missile_collider = MissileCollider(self.arena, self.missiles, self.tanks, self.explosions, self.registry, self.missile_pool, self.explosion_pool)
 
-        self.targets = [] 
-        self.targets.append(Target(5, 5, "green"))
-        self.targets.append(Target(13, 13, "red"))
-        self.targets.append(Target(21, 21, "blue"))
-        self.targets.append(Target(29, 29, "orange"))
-        self.targets.append(Target(37, 37, "black"))
-        self.targets.append(Target(45, 45, "purple"))
+        self.tank_updater = TankUpdater(self.arena, self.missiles, self.tanks, self.targets, self.registry, self.missile_pool, write_scans=not self.headless)
 
-        self.tank_updater = TankUpdater(self.arena, self.missiles, self.tanks, self.targets)
-        
-        self.scores = {}
-        self.scores["green"] = 0
-        self.scores["red"] = 0
-        self.scores["blue"] = 0
-        self.scores["orange"] = 0
-        self.scores["black"] = 0
-        self.scores["purple"] = 0
-
-        self.target_collider = TargetCollider(self.arena, self.targets, self.tanks, self.scores)
+        self.target_collider = TargetCollider(self.arena, self.targets, self.tanks, self.scores, self.registry, self.spawn_placer)
         
         self.turn = 0
 
         self.game_runner = GameRunner()
-        self.game_runner.pause()
-
         self.game_writer = GameWriter()
-        self.game_writer.write(self)
-        
         self.game_cleaner = GameCleaner()
-        self.game_cleaner.clean(self)
-        
-        
-    def update(self, tanks, missiles):
-        if time.time() - self.last_update > 1.:
-            self.last_update = time.time()
-            
+        self.match_recorder = None
+        self.metrics = TurnMetrics()
+        self.metrics_writer = MetricsWriter(metrics_interval)
+        # In-process players, by color, deciding for their tank before every turn
+        self.bots: dict[str, Bot] = {}
+        # Calls the bots concurrently with a deadline when set, one after the other otherwise
+        self.bot_scheduler = None
+
+        if not self.headless:
+            self.action_listener = ActionListener(self.action_table)
+            self.game_runner.pause()
+            self.game_writer.write(self)
+            self.game_cleaner.clean(self)
+
+    def step(self):
+        if self.bots:
+            with self.metrics.phase("bots"):
+                self.decide_bots()
+
+        if self.match_recorder is not None:
+            with self.metrics.phase("record"):
+                self.match_recorder.record_turn(self)
+
+        with self.metrics.phase("tanks"):
+            for tank in self.tanks:
+                self.tank_updater.update(self.turn, tank)
+
+        with self.metrics.phase("missiles"):
+            self.missile_updater.update_all(self.missiles)
+
+        with self.metrics.phase("missile_collisions"):
+            self.missile_collider.collide()
+        with self.metrics.phase("target_collisions"):
+            self.target_collider.collide()
+        self.turn += 1
+
+    def decide_bots(self):
+        # Shared by the observations of the turn, rather than copied for every tank
+        positions = tuple((tank.x, tank.y) for tank in self.tanks)
+        observations = {
+            tank.color: Observation.of(self, tank, OtherTanks(positions, index))
+            for index, tank in enumerate(self.tanks) if tank.color in self.bots
+        }
+        if self.bot_scheduler is None:
+            actions = {color: self.bots[color].decide(observation) for color, observation in observations.items()}
+        else:
+            actions = self.bot_scheduler.decide(self.bots, observations)
+        for tank in self.tanks:
+            if tank.color in observations:
+                # A late bot keeps its tank idle for the turn
+                tank.next_action = actions.get(tank.color)
+
+    def run_turns(self, turns: int):
+        last_turn = self.turn + turns
+        while self.turn < last_turn:
+            if self.pacer.is_due():
+                self.step()
+            else:
+                self.pacer.wait()
+
+    def update(self):
+        if self.pacer.is_due():
             if not self.game_runner.is_running():
                 if self.game_runner.is_reset():
                     self.reset()
@@ -82,57 +150,131 @@ class Game:
                 self.game_writer.write(self)
                 return 
             
-            for tank in tanks:
-                self.tank_actioner.read_action(tank, self.turn)
-                self.tank_updater.update(self.turn, tank)
-        
-            for missile in missiles:
-                self.missile_updater.update(missile)
-            
-            self.missile_collider.collide()
-            self.target_collider.collide()
-            self.turn += 1
-            self.game_writer.write(self)
-            self.game_cleaner.clean(self)
+            with self.metrics.phase("turn"):
+                with self.metrics.phase("actions"):
+                    for tank in self.tanks:
+                        self.tank_actioner.read_action(tank, self.turn)
+                self.step()
+                with self.metrics.phase("write"):
+                    self.game_writer.write(self)
+                with self.metrics.phase("clean"):
+                    self.game_cleaner.clean(self)
+            self.metrics_writer.write(self)
 
-        if time.time() - self.last_update > 0.11:
-            time.sleep(0.1)
+        self.pacer.wait()
 
     def run(self):
-        while True:
-            self.update(self.tanks, self.missiles)
+        try:
+            while True:
+                self.update()
+        finally:
+            self.game_writer.close()
+            self.metrics_writer.close()
+            self.action_listener.close()
+            if self.match_recorder is not None:
+                self.match_recorder.close()
+            if self.bot_scheduler is not None:
+                self.bot_scheduler.close()
+
+    def record(self, path: str, checkpoint_interval: int = 100):
+        """
+        Append the seed, the config and the actions of every turn to a match log, see MatchReplayer.
+        """
+        self.match_recorder = MatchRecorder(path, checkpoint_interval)
+        self.match_recorder.start_match(self)
+
+    def checkpoint(self) -> dict:
+        return {
+            "turn": self.turn,
+            "registry": self.registry,
+            # Only used by the missile array, the registry holds the other missiles
+            "missiles": list(self.missiles) if isinstance(self.missiles, MissileArray) else [],
+            "explosions": self.explosions,
+            "scores": self.scores,
+            "random": self.random.getstate(),
+            "free_cells": self.free_cells,
+            "next_missile_id": self.tank_updater.tank_firer.next_missile_id,
+        }
+
+    def restore(self, checkpoint: dict):
+        # The components share these lists, so they are refilled rather than replaced
+        self.registry.restore(checkpoint["registry"])
+        self.explosions[:] = checkpoint["explosions"]
+        if isinstance(self.missiles, MissileArray):
+            self.missiles.clear()
+            for missile in checkpoint["missiles"]:
+                self.missiles.append(missile)
+        self.scores.clear()
+        self.scores.update(checkpoint["scores"])
+        self.random.setstate(checkpoint["random"])
+        self.tank_updater.tank_firer.next_missile_id = checkpoint["next_missile_id"]
+        self.turn = checkpoint["turn"]
+        self.arena.index(self.tanks, self.missiles, self.targets)
+        self.free_cells.restore(checkpoint["free_cells"])
+
+    def spawn(self):
+        self.registry.clear("tanks")
+        self.registry.clear("targets")
+        self.scores.clear()
+        self.arena.index(self.tanks, self.missiles, self.targets)
+        # Every cell is free again: a match spawns the same whatever was played before
+        self.free_cells.reset()
+        for color, (x, y) in zip(self.config.players, self.spawn_placer.tank_positions(self.config)):
+            tank = Tank(x, y, color)
+            target = Target(x, y, color)
+            self.registry.add(tank)
+            self.registry.add(target)
+            # Before the next position is drawn from the free cells
+            self.arena.tank_index.add(tank)
+            self.arena.target_index.add(target)
+            self.scores[color] = 0
 
     def reset(self):
+        self.explosion_pool.release_all(self.explosions)
         self.explosions.clear()
+        if not isinstance(self.missiles, MissileArray):
+            self.missile_pool.release_all(self.missiles)
         self.missiles.clear()
-        self.tanks.clear()
-        self.tanks.append(Tank(5, 5, "green"))
-        self.tanks.append(Tank(13, 13, "red"))
-        self.tanks.append(Tank(21, 21, "blue"))
-        self.tanks.append(Tank(29, 29, "orange"))
-        self.tanks.append(Tank(37, 37, "black"))
-        self.tanks.append(Tank(45, 45, "purple"))
-
-        self.targets.clear()
-        self.targets.append(Target(5, 5, "green"))
-        self.targets.append(Target(13, 13, "red"))
-        self.targets.append(Target(21, 21, "blue"))
-        self.targets.append(Target(29, 29, "orange"))
-        self.targets.append(Target(37, 37, "black"))
-        self.targets.append(Target(45, 45, "purple"))
-        
-        self.scores.clear()
-        self.scores["green"] = 0
-        self.scores["red"] = 0
-        self.scores["blue"] = 0
-        self.scores["orange"] = 0
-        self.scores["black"] = 0
-        self.scores["purple"] = 0
+        # A new match numbers its entities from scratch, as a replay of it does
+        self.registry.reset()
+        # The new match gets its own seed, drawn from the previous one to stay reproducible
+        self.seed = self.random.randrange(2**32)
+        self.random.seed(self.seed)
+        self.tank_updater.tank_firer.next_missile_id = 0
+        self.spawn()
         
         self.turn = 0
-        self.game_writer.write(self)
-        self.game_cleaner.clean(self)
-        self.game_runner.pause()
+        self.action_table.clear()
+        if self.match_recorder is not None:
+            self.match_recorder.start_match(self)
+        if not self.headless:
+            self.game_writer.write(self, force=True)
+            self.game_cleaner.clean(self)
+            self.game_runner.pause()
 
 if __name__ == '__main__':
-    game = Game().run()
\ No newline at end of file
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--width", type=int, default=50, help="cells per row")
+    parser.add_argument("--height", type=int, default=50, help="cells per column")
+    parser.add_argument("--players", type=int, default=6)
+    parser.add_argument("--spawn-policy", choices=["diagonal", "random"], default="diagonal")
+    parser.add_argument("--target-spawn-policy", choices=list(SPAWN_POLICIES), default="uniform", help="where reached targets respawn")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--record", metavar="PATH", help="append the match to a log that MatchReplayer can replay")
+    parser.add_argument("--bot", action="append", default=[], metavar="COLOR=BOT", help="play a color with an in-process bot of tankwar.ai.bots, e.g. blue=seeker")
+    parser.add_argument("--metrics-interval", type=float, default=10., metavar="SECONDS", help="how often to print and publish the turn metrics")
+    parser.add_argument("--bot-deadline", type=float, metavar="SECONDS", help="call the bots concurrently and drop the decisions not made in time")
+    args = parser.parse_args()
+    config = GameConfig(args.width, args.height, player_names(args.players), args.spawn_policy, args.target_spawn_policy, seed=args.seed)
+    game = Game(config, metrics_interval=args.metrics_interval)
+    if args.bot:
+        from tankwar.ai.bots import BOTS
+        for bot_arg in args.bot:
+            color, name = bot_arg.split("=")
+            game.bots[color] = BOTS[name]()
+        if args.bot_deadline is not None:
+            game.bot_scheduler = BotScheduler(args.bot_deadline)
+    if args.record:
+        game.record(args.record)
+    game.run()
\ No newline at end of file
@@ -0,0 +1,21 @@
+from dataclasses import dataclass, field
+
+from tankwar.logic.colors import PLAYER_ORDER, player_names
+
+@dataclass
+class GameConfig:
+    cell_per_row: int = 50
+    cell_per_col: int = 50
+    players: list[str] = field(default_factory=lambda: list(PLAYER_ORDER))
+    # "diagonal" spreads the players evenly along the arena diagonal,
+    # "random" picks distinct random cells
+    spawn_policy: str = "diagonal"
+    # Where a reached target respawns, see SpawnPlacer
+    target_spawn_policy: str = "uniform"
+    vectorized_missiles: bool = False
+    # Seed of the game random generator, a random seed is picked when None
+    seed: int = None
+
+    @classmethod
+    def scaled(cls, size: int, player_count: int, **kwargs) -> "GameConfig":
+        return cls(cell_per_row=size, cell_per_col=size, players=player_names(player_count), **kwargs)
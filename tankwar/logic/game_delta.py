@@ -0,0 +1,106 @@
+import collections
+import json
+
+class GameDeltaTracker:
+    """
+    Computes what changed in the game since the previous call.
+
+    Tanks, missiles and targets are identified by their id, so a target
+    reached by its tank is destroyed and respawns as a new target. Moved
+    missiles only carry their new position, their orientation never changes.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.tanks = {}
+        self.missiles = {}
+        self.targets = {}
+        self.scores = {}
+
+    def compute(self, game: "Game") -> dict:
+        tanks = {tank.id: (tank.x, tank.y, tank.color, tank.orientation.value, tank.turret_orientation.value) for tank in game.tanks}
+        missiles = {missile.id: (missile.x, missile.y, missile.color, missile.orientation.value) for missile in game.missiles}
+        targets = {target.id: (target.x, target.y, target.color) for target in game.targets}
+
+        def tank_record(tank_id, tank):
+            return {"id": tank_id, "color": tank[2], "x": tank[0], "y": tank[1], "orientation": tank[3], "turret_orientation": tank[4]}
+
+        def target_record(target_id, target):
+            return {"id": target_id, "color": target[2], "x": target[0], "y": target[1]}
+
+        def spawned_missile_record(missile_id, missile):
+            return {"id": missile_id, "x": missile[0], "y": missile[1], "color": missile[2], "orientation": missile[3]}
+
+        def moved_missile_record(missile_id, missile):
+            return {"id": missile_id, "x": missile[0], "y": missile[1]}
+
+        delta = {
+            "turn": game.turn,
+            "tanks": self.diff(self.tanks, tanks, tank_record, tank_record),
+            "missiles": self.diff(self.missiles, missiles, spawned_missile_record, moved_missile_record),
+            "targets": self.diff(self.targets, targets, target_record, target_record),
+            "explosions": [{"x": explosion.x, "y": explosion.y} for explosion in game.explosions],
+            "scores": {color: score for color, score in game.scores.items() if self.scores.get(color) != score},
+        }
+
+        self.tanks, self.missiles, self.targets, self.scores = tanks, missiles, targets, dict(game.scores)
+        return delta
+
+    @staticmethod
+    def diff(previous: dict, current: dict, spawned_record, moved_record) -> dict:
+        spawned, moved = [], []
+        for key, value in current.items():
+            previous_value = previous.get(key)
+            if previous_value is None:
+                spawned.append(spawned_record(key, value))
+            elif previous_value != value:
+                moved.append(moved_record(key, value))
+        destroyed = [key for key in previous if key not in current]
+        return {"spawned": spawned, "moved": moved, "destroyed": destroyed}
+
+class DeltaLog:
+    """
+    The last deltas, each encoded to JSON once, published as a single JSON
+    document along with the current status.
+
+    The log belongs to one match, from its base turn on: clients following
+    another match, or from before the base turn, need a keyframe.
+    """
+
+    def __init__(self, max_deltas: int = 32):
+        self.deltas = collections.deque(maxlen=max_deltas)
+        self.match = 0
+        self.base_turn = 0
+
+    def append(self, delta: dict):
+        self.deltas.append(json.dumps(delta))
+
+    def clear(self, match: int = 0, base_turn: int = 0):
+        self.deltas.clear()
+        self.match = match
+        self.base_turn = base_turn
+
+    def encode(self, turn: int, status, max_size: int) -> bytes:
+        while True:
+            content = f'{{"match": {self.match}, "base_turn": {self.base_turn}, "turn": {turn}, "status": {json.dumps(status)}, "deltas": [{", ".join(self.deltas)}]}}'.encode("utf-8")
+            if len(content) <= max_size or not self.deltas:
+                return content
+            # Clients that far behind get a keyframe instead
+            self.deltas.popleft()
+
+def deltas_since(delta_log: dict, since: int, match: int):
+    """
+    Deltas a client of a match at turn `since` needs to catch up with the
+    published log, or None when the client followed another match or the log
+    no longer reaches back that far, and a keyframe is needed.
+    """
+    deltas = delta_log["deltas"]
+    if since is None or match != delta_log["match"]:
+        return None
+    if since < delta_log["base_turn"] or since > delta_log["turn"]:
+        return None
+    if since < delta_log["turn"] and (not deltas or deltas[0]["turn"] > since + 1):
+        return None
+    return [delta for delta in deltas if delta["turn"] > since]
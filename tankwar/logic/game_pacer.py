@@ -0,0 +1,25 @@
+import time
+
+class RealTimePacer:
+
+    def __init__(self, period: float = 1.):
+        self.period = period
+        self.last_tick = time.time()
+
+    def is_due(self):
+        if time.time() - self.last_tick > self.period:
+            self.last_tick = time.time()
+            return True
+        return False
+
+    def wait(self):
+        if time.time() - self.last_tick > 0.11:
+            time.sleep(0.1)
+
+class FastForwardPacer:
+
+    def is_due(self):
+        return True
+
+    def wait(self):
+        pass
@@ -1,46 +1,60 @@
-import json
+import os
+import time
+
+from tankwar.logic.game_delta import DeltaLog, GameDeltaTracker
+from tankwar.logic.snapshot_codec import encode_snapshot
+from tankwar.logic.state_channel import DELTA_CHANNEL_NAME, DELTA_CHANNEL_SIZE, StateChannel
 
 class GameWriter:
-    
-    def write(self, game:"Game"):
-        json_dict = {
-            "status": game.game_runner.get_status(),
-            "turn": game.turn,
-            "arena": {
-                "cell_per_row": game.arena.cell_per_row,
-                "cell_per_col": game.arena.cell_per_col
-            },
-            "tanks": [
-                {
-                    "x": tank.x,
-                    "y": tank.y,
-                    "color": tank.color,
-                    "orientation": tank.orientation.value,
-                    "turret_orientation": tank.turret_orientation.value,
-                } for tank in game.tanks
-            ],
-            "missiles": [
-                {
-                    "x": missile.x,
-                    "y": missile.y,
-                    "color": missile.color,
-                    "orientation": missile.orientation.value,
-                } for missile in game.missiles
-            ],
-            "explosions": [
-                {
-                    "x": explosion.x,
-                    "y": explosion.y,
-                } for explosion in game.explosions
-            ],
-            "targets": [
-                {
-                    "x": target.x,
-                    "y": target.y,
-                    "color": target.color,
-                } for target in game.targets
-            ], 
-            "scores": game.scores,
-        }
-        with open("game.json", "w") as file:
-            file.write(json.dumps(json_dict, indent=4))
\ No newline at end of file
+
+    def __init__(self):
+        self.state_channel = None
+        self.delta_channel = None
+        self.last_written = None
+        self.delta_tracker = GameDeltaTracker()
+        self.delta_log = DeltaLog()
+        self.last_delta_turn = None
+        # Identifies the current match to the clients of the deltas, drawn again for every new game
+        self.match = 0
+        self.turn_timestamp = None
+        self.bytes_written = 0
+
+    def write(self, game:"Game", force: bool = False):
+        status = game.game_runner.get_status()
+        # While paused, the game writes every tick although nothing changed
+        if not force and self.last_written == (game.turn, status):
+            return
+        if force or self.last_written is None or self.last_written[0] != game.turn:
+            self.turn_timestamp = time.time()
+        self.last_written = (game.turn, status)
+
+        if force or self.last_delta_turn is None:
+            # Not drawn from game.random, which would change the match being played
+            self.match = int.from_bytes(os.urandom(4), "little")
+        if self.state_channel is None:
+            self.state_channel = StateChannel(create=True)
+            self.delta_channel = StateChannel(DELTA_CHANNEL_NAME, create=True, size=DELTA_CHANNEL_SIZE)
+        snapshot = encode_snapshot(game, status, self.turn_timestamp, self.match)
+        self.state_channel.publish(game.turn, snapshot)
+        self.bytes_written += len(snapshot)
+        self.write_delta(game, status, force)
+
+    def write_delta(self, game:"Game", status, force: bool):
+        if force or self.last_delta_turn is None:
+            # A new game: the snapshot is the new baseline
+            self.delta_tracker.reset()
+            self.delta_log.clear(self.match, game.turn)
+            self.delta_tracker.compute(game)
+        elif game.turn != self.last_delta_turn:
+            self.delta_log.append(self.delta_tracker.compute(game))
+        self.last_delta_turn = game.turn
+        deltas = self.delta_log.encode(game.turn, status, self.delta_channel.capacity())
+        self.delta_channel.publish(game.turn, deltas)
+        self.bytes_written += len(deltas)
+
+    def close(self):
+        if self.state_channel is not None:
+            self.state_channel.close()
+            self.delta_channel.close()
+            self.state_channel = None
+            self.delta_channel = None
@@ -0,0 +1,75 @@
+import dataclasses
+import json
+import struct
+
+from tankwar.logic.checkpoint_codec import encode_checkpoint
+from tankwar.logic.tank import Action
+
+# Every record is its length, then its kind, then its payload
+RECORD_HEADER = struct.Struct("<IB")
+
+# Payload: JSON {"seed", "config"}. Starts a match, a log holds one match per game reset
+MATCH_RECORD = 1
+# Payload: turn, then a (player index, action) per tank, action 0 being no action
+TURN_RECORD = 2
+# Payload: turn, then the Game.checkpoint() taken before playing that turn, see encode_checkpoint
+CHECKPOINT_RECORD = 3
+
+TURN = struct.Struct("<q")
+TANK_ACTION = struct.Struct("<HB")
+
+class MatchRecorder:
+    """
+    Append-only log of everything needed to replay a match: its seed, its
+    config and the action of every tank at every turn, with a checkpoint of
+    the whole game every checkpoint_interval turns to replay from.
+    """
+
+    def __init__(self, path: str, checkpoint_interval: int = 100):
+        self.file = open(path, "ab")
+        self.checkpoint_interval = checkpoint_interval
+        self.player_ids = {}
+
+    def write_record(self, kind: int, payload: bytes):
+        self.file.write(RECORD_HEADER.pack(len(payload), kind))
+        self.file.write(payload)
+
+    def start_match(self, game: "Game"):
+        self.player_ids = {player: i for i, player in enumerate(game.config.players)}
+        header = {"seed": game.seed, "config": dataclasses.asdict(game.config)}
+        self.write_record(MATCH_RECORD, json.dumps(header).encode("utf-8"))
+        self.file.flush()
+
+    def record_turn(self, game: "Game"):
+        if game.turn % self.checkpoint_interval == 0:
+            self.write_record(CHECKPOINT_RECORD, TURN.pack(game.turn) + encode_checkpoint(game.checkpoint()))
+
+        actions = b"".join(
+            TANK_ACTION.pack(self.player_ids[tank.color], tank.next_action.value if tank.next_action is not None else 0)
+            for tank in game.tanks
+        )
+        self.write_record(TURN_RECORD, TURN.pack(game.turn) + actions)
+
+    def close(self):
+        self.file.close()
+
+def read_records(path: str):
+    with open(path, "rb") as file:
+        while True:
+            header = file.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                # End of the log, or a record cut short by a crash
+                return
+            length, kind = RECORD_HEADER.unpack(header)
+            payload = file.read(length)
+            if len(payload) < length:
+                return
+            yield kind, payload
+
+def decode_actions(payload: bytes, players: list[str]) -> tuple[int, dict[str, Action]]:
+    turn, = TURN.unpack_from(payload)
+    actions = {
+        players[player_id]: Action(action) if action else None
+        for player_id, action in TANK_ACTION.iter_unpack(payload[TURN.size:])
+    }
+    return turn, actions
@@ -0,0 +1,58 @@
+import bisect
+import json
+
+from tankwar.logic.checkpoint_codec import CHECKPOINT_VERSION, checkpoint_version, decode_checkpoint
+from tankwar.logic.game import Game
+from tankwar.logic.game_config import GameConfig
+from tankwar.logic.match_recorder import CHECKPOINT_RECORD, MATCH_RECORD, TURN, TURN_RECORD, decode_actions, read_records
+
+class MatchReplayer:
+    """
+    Rebuilds any turn of a match recorded by MatchRecorder, by replaying the
+    recorded actions from the closest checkpoint before that turn.
+    """
+
+    def __init__(self, path: str, match: int = -1):
+        matches = []
+        for kind, payload in read_records(path):
+            if kind == MATCH_RECORD:
+                header = json.loads(payload)
+                matches.append((header, {}, {}))
+            elif kind == TURN_RECORD:
+                header, actions, _ = matches[-1]
+                turn, turn_actions = decode_actions(payload, header["config"]["players"])
+                actions[turn] = turn_actions
+            elif kind == CHECKPOINT_RECORD:
+                turn, = TURN.unpack_from(payload)
+                checkpoint = payload[TURN.size:]
+                # Checkpoints of older logs, such as pickled ones, are never loaded: the turns are replayed instead
+                if checkpoint and checkpoint_version(checkpoint) == CHECKPOINT_VERSION:
+                    # Kept encoded: only the one replayed from is ever decoded
+                    matches[-1][2][turn] = checkpoint
+        if not matches:
+            raise ValueError(f"No match recorded in {path}")
+
+        header, self.actions, self.checkpoints = matches[match]
+        self.seed = header["seed"]
+        self.config = GameConfig(**{**header["config"], "seed": self.seed})
+        self.checkpoint_turns = sorted(self.checkpoints)
+        self.last_turn = max(self.actions) + 1 if self.actions else 0
+
+    def game_at(self, turn: int) -> Game:
+        """
+        A headless game in the state it was in when it reached `turn`.
+        """
+        if turn > self.last_turn:
+            raise ValueError(f"Turn {turn} was not recorded, the match stops at turn {self.last_turn}")
+
+        game = Game(self.config, headless=True)
+        index = bisect.bisect_right(self.checkpoint_turns, turn) - 1
+        if index >= 0:
+            game.restore(decode_checkpoint(self.checkpoints[self.checkpoint_turns[index]]))
+
+        while game.turn < turn:
+            actions = self.actions[game.turn]
+            for tank in game.tanks:
+                tank.next_action = actions.get(tank.color)
+            game.step()
+        return game
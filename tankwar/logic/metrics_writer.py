@@ -0,0 +1,32 @@
+import json
+import time
+
+from tankwar.logic.state_channel import METRICS_CHANNEL_NAME, METRICS_CHANNEL_SIZE, StateChannel
+
+class MetricsWriter:
+    """
+    Every `interval` seconds, prints a summary line of the turn metrics and
+    publishes them as JSON for the /metrics endpoint of the server.
+    """
+
+    def __init__(self, interval: float = 10.):
+        self.interval = interval
+        self.channel = None
+        self.last_report = time.monotonic()
+
+    def write(self, game: "Game"):
+        now = time.monotonic()
+        if now - self.last_report < self.interval:
+            return
+        self.last_report = now
+
+        game.metrics.count(game)
+        print(game.metrics.summary_line())
+        if self.channel is None:
+            self.channel = StateChannel(METRICS_CHANNEL_NAME, create=True, size=METRICS_CHANNEL_SIZE)
+        self.channel.publish(game.turn, json.dumps(game.metrics.summary()).encode("utf-8"))
+
+    def close(self):
+        if self.channel is not None:
+            self.channel.close()
+            self.channel = None
@@ -2,8 +2,11 @@ from tankwar.logic.orientation import Orientation
 
 class Missile:
 
-    def __init__(self, x:int, y:int, orientation:Orientation, color:str):
+    __slots__ = ("next_action", "id", "x", "y", "color", "orientation")
+
+    def __init__(self, x:int, y:int, orientation:Orientation, color:str, missile_id:int = 0):
         self.next_action = None 
+        self.id = missile_id
         self.x = x
         self.y = y
         self.color = color
@@ -0,0 +1,57 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from tankwar.logic.arena import Arena
+from tankwar.logic.entity_pool import EntityPool
+from tankwar.logic.entity_registry import EntityRegistry
+from tankwar.logic.explosion import Explosion
+from tankwar.logic.missile_array import MissileArray
+from tankwar.logic.tank import Tank
+
+class MissileArrayCollider:
+    """
+    Vectorized MissileCollider for a MissileArray.
+
+    Missiles are grouped by cell id with a sort, so missile against missile
+    and missile against tank collisions cost O(M log M + T) per turn.
+    """
+
+    def __init__(self, arena: Arena, missiles: MissileArray, tanks: list[Tank], explosions, registry: EntityRegistry, explosion_pool: EntityPool = None):
+        self.arena = arena
+        self.missiles = missiles
+        self.explosions = explosions
+        self.tanks = tanks
+        self.registry = registry
+        self.explosion_pool = explosion_pool or EntityPool(Explosion)
+
+    def collide(self):
+        self.explosion_pool.release_all(self.explosions)
+        self.explosions.clear()
+        if len(self.missiles) == 0:
+            return
+
+        cell_per_row = self.arena.cell_per_row
+        cells, inverse, counts = np.unique(self.missiles.cell_ids(self.arena), return_inverse=True, return_counts=True)
+        tank_cells = np.array([tank.y * cell_per_row + tank.x for tank in self.tanks], dtype=np.int64)
+        is_tank_cell = np.isin(cells, tank_cells)
+
+        # Same explosions as MissileCollider: one per extra missile on a shared
+        # cell and one per missile hitting a tank
+        explosion_counts = np.where(counts > 1, counts - 1, 0) + np.where(is_tank_cell, counts, 0)
+        for cell in np.flatnonzero(explosion_counts):
+            y, x = divmod(int(cells[cell]), cell_per_row)
+            for _ in range(explosion_counts[cell]):
+                self.explosions.append(self.explosion_pool.acquire(x, y))
+
+        hit_cells = (counts > 1) | is_tank_cell
+        if hit_cells.any():
+            self.missiles.keep(~hit_cells[inverse])
+
+        if is_tank_cell.any():
+            destroyed_cells = set(cells[is_tank_cell].tolist())
+            tanks_to_remove = [tank for tank in self.tanks if tank.y * cell_per_row + tank.x in destroyed_cells]
+            for tank in tanks_to_remove:
+                self.arena.tank_index.remove(tank)
+            self.registry.remove_all(tanks_to_remove)
@@ -1,39 +1,47 @@
+from tankwar.logic.arena import Arena
+from tankwar.logic.entity_pool import EntityPool
+from tankwar.logic.entity_registry import EntityRegistry
 from tankwar.logic.explosion import Explosion
 from tankwar.logic.missile import Missile
 from tankwar.logic.tank import Tank
 
 class MissileCollider:
 
-    def __init__(self, missiles: list[Missile], tanks: list[Tank], explosions):
+    def __init__(self, arena: Arena, missiles: list[Missile], tanks: list[Tank], explosions, registry: EntityRegistry, missile_pool: EntityPool = None, explosion_pool: EntityPool = None):
+        self.arena = arena
         self.missiles = missiles
         self.explosions = explosions
         self.tanks = tanks  
+        self.registry = registry
+        self.missile_pool = missile_pool or EntityPool(Missile)
+        self.explosion_pool = explosion_pool or EntityPool(Explosion)
 
     def collide(self):
+        self.explosion_pool.release_all(self.explosions)
         self.explosions.clear()
 
         missiles_to_remove = set()
         tanks_to_remove = set()
 
-        for i in range(0, len(self.missiles)):
-            for j in range(i + 1, len(self.missiles)):
-                m1, m2 = self.missiles[i], self.missiles[j]
-                if m1.x == m2.x and m1.y == m2.y:
-                    missiles_to_remove.add(m1)
-                    missiles_to_remove.add(m2)
-                    self.explosions.append(Explosion(m1.x, m1.y))
-                    break
+        for (x, y), missiles in self.arena.missile_index.cells():
+            if len(missiles) > 1:
+                missiles_to_remove.update(missiles)
+                for _ in range(len(missiles) - 1):
+                    self.explosions.append(self.explosion_pool.acquire(x, y))
 
-        for i in range(0, len(self.missiles)):
-            for j in range(0, len(self.tanks)):
-                m, t = self.missiles[i], self.tanks[j]
-                if m.x == t.x and m.y == t.y:
-                    missiles_to_remove.add(m)
-                    tanks_to_remove.add(t)
-                    self.explosions.append(Explosion(m.x, m.y))
-                    break
-        
-        for missile in missiles_to_remove:
-            self.missiles.remove(missile)
-        for tank in tanks_to_remove:
-            self.tanks.remove(tank)
\ No newline at end of file
+            tanks = self.arena.tank_index.at(x, y)
+            if tanks:
+                missiles_to_remove.update(missiles)
+                tanks_to_remove.update(tanks)
+                for _ in missiles:
+                    self.explosions.append(self.explosion_pool.acquire(x, y))
+
+        if missiles_to_remove:
+            for missile in missiles_to_remove:
+                self.arena.missile_index.remove(missile)
+            self.registry.remove_all(missiles_to_remove)
+            self.missile_pool.release_all(missiles_to_remove)
+        if tanks_to_remove:
+            for tank in tanks_to_remove:
+                self.arena.tank_index.remove(tank)
+            self.registry.remove_all(tanks_to_remove)
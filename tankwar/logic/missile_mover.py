@@ -5,6 +5,7 @@ from tankwar.logic.arena import Arena
 class MissileMover:
 
     def move_forward(self, missile: Missile, arena: Arena):
+        x0, y0 = missile.x, missile.y
         match missile.orientation:
             case Orientation.NORTH:
                 missile.y -= 1
@@ -15,6 +16,7 @@ class MissileMover:
             case Orientation.WEST:
                 missile.x -= 1
         self.handle_movement_out_of_arena(missile, arena)
+        arena.missile_index.move(missile, x0, y0)
         
     def handle_movement_out_of_arena(self, missile: Missile, arena: Arena):
         if missile.y == -1:
@@ -1,5 +1,6 @@
 from tankwar.logic.arena import Arena
 from tankwar.logic.missile import Missile
+from tankwar.logic.missile_array import MissileArray
 from tankwar.logic.missile_mover import MissileMover
 
 class MissileUpdater:
@@ -9,5 +10,11 @@ class MissileUpdater:
         self.missile_mover = MissileMover()
 
     def update(self, missile: Missile):
-        self.missile_mover.move_forward(missile, self.arena) 
-    
\ No newline at end of file
+        self.missile_mover.move_forward(missile, self.arena)
+
+    def update_all(self, missiles: list[Missile] | MissileArray):
+        if isinstance(missiles, MissileArray):
+            missiles.move_forward(self.arena)
+            return
+        for missile in missiles:
+            self.update(missile)
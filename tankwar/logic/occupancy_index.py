@@ -0,0 +1,52 @@
+class OccupancyIndex:
+    """
+    Entities grouped by the cell they stand on.
+
+    Only occupied cells are stored, so the index stays small on large arenas and
+    finding what stands on a cell is a single dict lookup. An optional listener
+    is told when a cell starts and stops being occupied, see FreeCellIndex.
+    """
+
+    def __init__(self, listener=None):
+        self.entities_per_cell: dict[tuple[int, int], list] = {}
+        self.listener = listener
+
+    def add(self, entity):
+        cell = (entity.x, entity.y)
+        entities = self.entities_per_cell.get(cell)
+        if entities is None:
+            entities = self.entities_per_cell[cell] = []
+            if self.listener is not None:
+                self.listener.occupy(*cell)
+        entities.append(entity)
+
+    def remove(self, entity, x: int = None, y: int = None):
+        cell = (entity.x if x is None else x, entity.y if y is None else y)
+        entities = self.entities_per_cell[cell]
+        entities.remove(entity)
+        if not entities:
+            del self.entities_per_cell[cell]
+            if self.listener is not None:
+                self.listener.vacate(*cell)
+
+    def move(self, entity, x0: int, y0: int):
+        if (x0, y0) != (entity.x, entity.y):
+            self.remove(entity, x0, y0)
+            self.add(entity)
+
+    def at(self, x: int, y: int) -> list:
+        return self.entities_per_cell.get((x, y), [])
+
+    def is_occupied(self, x: int, y: int) -> bool:
+        return (x, y) in self.entities_per_cell
+
+    def cells(self) -> list[tuple[tuple[int, int], list]]:
+        return list(self.entities_per_cell.items())
+
+    def rebuild(self, entities):
+        if self.listener is not None:
+            for cell in self.entities_per_cell:
+                self.listener.vacate(*cell)
+        self.entities_per_cell.clear()
+        for entity in entities:
+            self.add(entity)
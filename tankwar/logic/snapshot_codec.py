@@ -0,0 +1,113 @@
+import json
+import struct
+
+from tankwar.logic.game_runner import GameStatus
+
+SNAPSHOT_MAGIC = b"TWS"
+SNAPSHOT_VERSION = 5
+SNAPSHOT_MEDIA_TYPE = "application/vnd.tankwar.snapshot"
+
+# magic, version, status, match, turn, timestamp, cell_per_row, cell_per_col, players, tanks, missiles, explosions, targets
+HEADER = struct.Struct("<3sBBIqdHHHIIII")
+TANK = struct.Struct("<QHHHBB")
+MISSILE = struct.Struct("<QHHHB")
+EXPLOSION = struct.Struct("<HH")
+TARGET = struct.Struct("<QHHH")
+SCORE = struct.Struct("<i")
+
+STATUSES = [None, GameStatus.PAUSED.value, GameStatus.RUNNING.value, GameStatus.RESET.value]
+
+def encode_snapshot(game: "Game", status, timestamp: float = 0., match: int = 0) -> bytes:
+    """
+    Pack the game state into fixed-width little endian records.
+
+    The match identifies the match the state belongs to, it changes when the
+    game is reset or restarted, see GameWriter. The timestamp is the time at which the game reached this turn, so that
+    clients can tell how long a turn lasts and interpolate between turns.
+
+    Colors are written once in the player table and referenced by index from
+    every entity record. Tanks, missiles and targets carry their id, which
+    stays the same across turns.
+    """
+    players = game.config.players
+    player_ids = {player: i for i, player in enumerate(players)}
+    missiles = list(game.missiles)
+
+    chunks = [HEADER.pack(
+        SNAPSHOT_MAGIC, SNAPSHOT_VERSION, STATUSES.index(status) if status in STATUSES else 0, match, game.turn, timestamp,
+        game.arena.cell_per_row, game.arena.cell_per_col,
+        len(players), len(game.tanks), len(missiles), len(game.explosions), len(game.targets),
+    )]
+    for player in players:
+        name = player.encode("utf-8")
+        chunks.append(bytes([len(name)]))
+        chunks.append(name)
+        chunks.append(SCORE.pack(game.scores.get(player, 0)))
+    chunks.extend(TANK.pack(tank.id, tank.x, tank.y, player_ids[tank.color], tank.orientation.value, tank.turret_orientation.value) for tank in game.tanks)
+    chunks.extend(MISSILE.pack(missile.id, missile.x, missile.y, player_ids[missile.color], missile.orientation.value) for missile in missiles)
+    chunks.extend(EXPLOSION.pack(explosion.x, explosion.y) for explosion in game.explosions)
+    chunks.extend(TARGET.pack(target.id, target.x, target.y, player_ids[target.color]) for target in game.targets)
+    return b"".join(chunks)
+
+def decode_snapshot(data: bytes) -> dict:
+    """
+    Decode a binary snapshot into the same dict as the JSON view of the state.
+    """
+    magic, version, status, match, turn, timestamp, cell_per_row, cell_per_col, player_count, tank_count, missile_count, explosion_count, target_count = HEADER.unpack_from(data, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("Not a tankwar snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version {version}, expected {SNAPSHOT_VERSION}")
+
+    offset = HEADER.size
+    players, scores = [], {}
+    for _ in range(player_count):
+        length = data[offset]
+        player = data[offset + 1:offset + 1 + length].decode("utf-8")
+        offset += 1 + length
+        scores[player], = SCORE.unpack_from(data, offset)
+        offset += SCORE.size
+        players.append(player)
+
+    def records(record: struct.Struct, count: int):
+        nonlocal offset
+        start = offset
+        offset += record.size * count
+        return record.iter_unpack(data[start:offset])
+
+    tanks = [
+        {"id": tank_id, "x": x, "y": y, "color": players[player], "orientation": orientation, "turret_orientation": turret_orientation}
+        for tank_id, x, y, player, orientation, turret_orientation in records(TANK, tank_count)
+    ]
+    missiles = [
+        {"id": missile_id, "x": x, "y": y, "color": players[player], "orientation": orientation}
+        for missile_id, x, y, player, orientation in records(MISSILE, missile_count)
+    ]
+    explosions = [{"x": x, "y": y} for x, y in records(EXPLOSION, explosion_count)]
+    targets = [{"id": target_id, "x": x, "y": y, "color": players[player]} for target_id, x, y, player in records(TARGET, target_count)]
+
+    return {
+        "status": STATUSES[status],
+        "match": match,
+        "turn": turn,
+        "timestamp": timestamp,
+        "arena": {
+            "cell_per_row": cell_per_row,
+            "cell_per_col": cell_per_col
+        },
+        "players": players,
+        "tanks": tanks,
+        "missiles": missiles,
+        "explosions": explosions,
+        "targets": targets,
+        "scores": scores,
+    }
+
+def snapshot_match(data: bytes) -> int:
+    """
+    The match of a snapshot, without decoding the rest of it.
+    """
+    return HEADER.unpack_from(data, 0)[3]
+
+def snapshot_to_json(data: bytes) -> str:
+    return json.dumps(decode_snapshot(data))
@@ -0,0 +1,32 @@
+import struct
+
+# Every snapshot is preceded by its length
+LENGTH = struct.Struct("<I")
+
+class SnapshotFileWriter:
+    """
+    Appends binary snapshots to a file, one per turn, to replay or render a match later.
+    """
+
+    def __init__(self, path: str):
+        self.file = open(path, "ab")
+
+    def append(self, snapshot: bytes):
+        self.file.write(LENGTH.pack(len(snapshot)))
+        self.file.write(snapshot)
+
+    def close(self):
+        self.file.close()
+
+def read_snapshots(path: str):
+    with open(path, "rb") as file:
+        while True:
+            header = file.read(LENGTH.size)
+            if len(header) < LENGTH.size:
+                # End of file, or a snapshot cut short by a crash
+                return
+            length, = LENGTH.unpack(header)
+            snapshot = file.read(length)
+            if len(snapshot) < length:
+                return
+            yield snapshot
@@ -0,0 +1,89 @@
+import random
+from typing import Iterator, Optional, Protocol
+
+from tankwar.logic.free_cell_index import FreeCellIndex
+from tankwar.logic.game_config import GameConfig
+
+class SpawnPolicy(Protocol):
+    """
+    Picks a free cell for an entity, given the cell of its owner if any.
+    """
+
+    def choose(self, free_cells: FreeCellIndex, rng: random.Random, owner: Optional[tuple[int, int]]) -> Optional[tuple[int, int]]:
+        ...
+
+class UniformPolicy:
+    """
+    Any free cell, with the same probability.
+    """
+
+    def choose(self, free_cells: FreeCellIndex, rng: random.Random, owner: Optional[tuple[int, int]]) -> Optional[tuple[int, int]]:
+        return free_cells.sample(rng)
+
+class FarFromOwnerPolicy:
+    """
+    The farthest from the owner of a few uniformly drawn free cells, on the
+    torus of the arena, so that a target does not respawn next to its tank.
+    """
+
+    def __init__(self, candidates: int = 8):
+        self.candidates = candidates
+
+    def choose(self, free_cells: FreeCellIndex, rng: random.Random, owner: Optional[tuple[int, int]]) -> Optional[tuple[int, int]]:
+        if owner is None or len(free_cells) == 0:
+            return free_cells.sample(rng)
+
+        def distance(cell: tuple[int, int]) -> int:
+            dx = abs(cell[0] - owner[0])
+            dy = abs(cell[1] - owner[1])
+            return min(dx, free_cells.cell_per_row - dx) + min(dy, free_cells.cell_per_col - dy)
+
+        return max((free_cells.sample(rng) for _ in range(self.candidates)), key=distance)
+
+SPAWN_POLICIES = {
+    "uniform": UniformPolicy,
+    "far_from_owner": FarFromOwnerPolicy,
+}
+
+class SpawnPlacer:
+    """
+    Where tanks spawn at the start of a match and targets respawn once
+    reached, drawn from the free cells with the random generator of the game.
+    """
+
+    def __init__(self, free_cells: FreeCellIndex, rng: random.Random, target_policy: str = "uniform"):
+        if target_policy not in SPAWN_POLICIES:
+            raise ValueError(f"Unknown target spawn policy: {target_policy}")
+        self.free_cells = free_cells
+        self.random = rng
+        self.target_policy = SPAWN_POLICIES[target_policy]()
+
+    def tank_positions(self, config: GameConfig) -> Iterator[tuple[int, int]]:
+        """
+        The cell of every player in turn. With the random policy every cell is
+        drawn from the cells still free, so the caller has to occupy a cell
+        before asking for the next one.
+        """
+        player_count = len(config.players)
+        if player_count > config.cell_per_row * config.cell_per_col:
+            raise ValueError(f"{player_count} players do not fit in a {config.cell_per_row}x{config.cell_per_col} arena")
+
+        match config.spawn_policy:
+            case "diagonal":
+                if player_count > min(config.cell_per_row, config.cell_per_col):
+                    raise ValueError(f"{player_count} players do not fit on the diagonal, use the random spawn policy")
+                step = min(config.cell_per_row, config.cell_per_col) // player_count
+                offset = min(step // 2 + 1, step - 1)
+                for i in range(player_count):
+                    yield (offset + i * step,) * 2
+            case "random":
+                for _ in range(player_count):
+                    yield self.free_cells.sample(self.random)
+            case _:
+                raise ValueError(f"Unknown spawn policy: {config.spawn_policy}")
+
+    def target_position(self, owner: Optional[tuple[int, int]] = None) -> Optional[tuple[int, int]]:
+        """
+        A free cell for a target, or None when the arena is full.
+        """
+        return self.target_policy.choose(self.free_cells, self.random, owner)
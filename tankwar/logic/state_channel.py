@@ -0,0 +1,157 @@
+import os
+import struct
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+STATE_CHANNEL_NAME = "tankwar_state"
+STATE_CHANNEL_SIZE = 16 * 1024 * 1024
+
+DELTA_CHANNEL_NAME = "tankwar_deltas"
+DELTA_CHANNEL_SIZE = 64 * 1024 * 1024
+
+METRICS_CHANNEL_NAME = "tankwar_metrics"
+METRICS_CHANNEL_SIZE = 1024 * 1024
+
+# sequence number, turn, payload length, pid of the writer (0 once it closed the channel)
+HEADER = struct.Struct("<QqII")
+SEQUENCE = struct.Struct("<Q")
+# turn and payload length, right after the sequence number
+PAYLOAD = struct.Struct("<qI")
+WRITER = struct.Struct("<I")
+WRITER_OFFSET = SEQUENCE.size + PAYLOAD.size
+
+# Retries of a read spinning on a publish in progress, before it starts sleeping and checking on the writer
+SPIN_RETRIES = 1000
+
+class StateChannel:
+    """
+    Shared memory snapshot of the game state, guarded by a seqlock.
+
+    The game process is the only writer: it makes the sequence number odd while
+    a snapshot is being copied in and even again once it is complete. Readers
+    retry until they see the same even sequence number before and after copying
+    the payload, so they never observe a half written snapshot. A writer killed
+    while publishing leaves the sequence number odd: readers give up with
+    FileNotFoundError once it is gone, or after read_timeout seconds.
+
+    The header also holds the pid of the writer, cleared when it closes the
+    channel. A restarted game unlinks the segment and creates a new one, which
+    readers that mapped the old one only notice through it, see reopen().
+    """
+
+    def __init__(self, name: str = STATE_CHANNEL_NAME, create: bool = False, size: int = STATE_CHANNEL_SIZE, read_timeout: float = 1.):
+        self.owner = create
+        self.read_timeout = read_timeout
+        if create:
+            try:
+                self.memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+            except FileExistsError:
+                # Left over by a game process that did not exit cleanly
+                self.memory = shared_memory.SharedMemory(name=name)
+            HEADER.pack_into(self.memory.buf, 0, 0, 0, 0, os.getpid())
+        else:
+            self.memory = shared_memory.SharedMemory(name=name)
+            # Only the owner may unlink the segment when it exits
+            resource_tracker.unregister(self.memory._name, "shared_memory")
+
+    def capacity(self) -> int:
+        return len(self.memory.buf) - HEADER.size
+
+    def publish(self, turn: int, payload: bytes):
+        buf = self.memory.buf
+        if HEADER.size + len(payload) > len(buf):
+            raise ValueError(f"State snapshot of {len(payload)} bytes does not fit in the channel")
+        sequence, = SEQUENCE.unpack_from(buf, 0)
+        SEQUENCE.pack_into(buf, 0, sequence + 1)
+        buf[HEADER.size:HEADER.size + len(payload)] = payload
+        PAYLOAD.pack_into(buf, SEQUENCE.size, turn, len(payload))
+        # Last, so that a reader seeing this sequence number also sees the turn and length written with it
+        SEQUENCE.pack_into(buf, 0, sequence + 2)
+
+    def is_live(self) -> bool:
+        """
+        Whether the process that wrote this segment is still running and has not closed it.
+        """
+        pid, = WRITER.unpack_from(self.memory.buf, WRITER_OFFSET)
+        if pid == 0:
+            return False
+        try :
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            # Running as another user
+            pass
+        return True
+
+    def read_sequence(self) -> int:
+        return SEQUENCE.unpack_from(self.memory.buf, 0)[0]
+
+    def read_turn(self) -> int:
+        buf = self.memory.buf
+        for _ in self.retries():
+            sequence, turn, _, _ = HEADER.unpack_from(buf, 0)
+            if sequence % 2 == 0 and SEQUENCE.unpack_from(buf, 0)[0] == sequence:
+                return turn
+
+    def retries(self):
+        """
+        Counts the attempts of a read, raising FileNotFoundError when the writer
+        died in the middle of a publish or does not complete it in time.
+        """
+        deadline = None
+        retry = 0
+        while True:
+            yield retry
+            retry += 1
+            if retry < SPIN_RETRIES:
+                continue
+            if deadline is None:
+                deadline = time.monotonic() + self.read_timeout
+            if not self.is_live():
+                raise FileNotFoundError(f"The writer of {self.memory.name} exited while publishing")
+            if time.monotonic() > deadline:
+                raise FileNotFoundError(f"The writer of {self.memory.name} did not complete its publish in {self.read_timeout} s")
+            time.sleep(0.001)
+
+    def wait_for_turn(self, after: int, timeout: float, poll_interval: float = 0.01) -> int:
+        deadline = time.monotonic() + timeout
+        turn = self.read_turn()
+        # Gives up early when the game exits, it would never publish another turn here
+        while turn == after and time.monotonic() < deadline and self.is_live():
+            time.sleep(poll_interval)
+            turn = self.read_turn()
+        return turn
+
+    def read(self) -> tuple[int, bytes]:
+        buf = self.memory.buf
+        for _ in self.retries():
+            sequence, turn, length, _ = HEADER.unpack_from(buf, 0)
+            if sequence % 2 == 1:
+                continue
+            payload = bytes(buf[HEADER.size:HEADER.size + length])
+            if SEQUENCE.unpack_from(buf, 0)[0] == sequence:
+                return turn, payload
+
+    def close(self):
+        if self.owner:
+            WRITER.pack_into(self.memory.buf, WRITER_OFFSET, 0)
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+
+def reopen(channel: StateChannel | None, name: str = STATE_CHANNEL_NAME) -> StateChannel:
+    """
+    The channel while its writer is alive, the segment of the current writer
+    otherwise, so that readers follow a restarted game. Raises
+    FileNotFoundError when no game is writing the channel.
+    """
+    # A stale channel is not closed: other threads may still be reading it, it is unmapped once dropped
+    if channel is not None and channel.is_live():
+        return channel
+    channel = StateChannel(name)
+    if not channel.is_live():
+        channel.close()
+        raise FileNotFoundError(f"No game is writing {name}")
+    return channel
+
@@ -14,8 +14,11 @@ class Action(enum.Enum):
 
 class Tank:
 
-    def __init__(self, x:int, y:int, color:str, orientation:Orientation = Orientation.NORTH, turret_orientation:Orientation = Orientation.NORTH):
+    __slots__ = ("next_action", "id", "x", "y", "orientation", "turret_orientation", "color")
+
+    def __init__(self, x:int, y:int, color:str, orientation:Orientation = Orientation.NORTH, turret_orientation:Orientation = Orientation.NORTH, tank_id:int = 0):
         self.next_action = None 
+        self.id = tank_id
         self.x = x
         self.y = y
         self.orientation = orientation
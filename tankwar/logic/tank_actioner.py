@@ -1,31 +1,33 @@
+from tankwar.logic.action_table import ActionTable
 from tankwar.logic.tank import Action, Tank
-import os
 
 class TankActioner:
 
+    def __init__(self, action_table: ActionTable):
+        self.action_table = action_table
+
     def read_action(self, tank: Tank, turn :int):
 
-        filename = f"{tank.color}_action_{turn}.txt"
-        if(not os.path.exists(filename)):
+        action = self.action_table.get(tank.color, turn)
+        if action is None:
             return 
-        
-        with open(filename, "r") as file:
-            action = file.read().strip()
-            if action == "FORWARD":
-                tank.next_action = Action.FORWARD
-            elif action == "BACKWARD":
-                tank.next_action = Action.BACKWARD
-            elif action == "TURN_LEFT":
-                tank.next_action = Action.TURN_LEFT
-            elif action == "TURN_RIGHT":
-                tank.next_action = Action.TURN_RIGHT
-            elif action == "TURN_TURRET_LEFT":
-                tank.next_action = Action.TURN_TURRET_LEFT
-            elif action == "TURN_TURRET_RIGHT":
-                tank.next_action = Action.TURN_TURRET_RIGHT
-            elif action == "FIRE":
-                tank.next_action = Action.FIRE
-            elif action == "SCAN":
-                tank.next_action = Action.SCAN
-            else:
-                tank.next_action = None
\ No newline at end of file
+
+        action = action.strip()
+        if action == "FORWARD":
+            tank.next_action = Action.FORWARD
+        elif action == "BACKWARD":
+            tank.next_action = Action.BACKWARD
+        elif action == "TURN_LEFT":
+            tank.next_action = Action.TURN_LEFT
+        elif action == "TURN_RIGHT":
+            tank.next_action = Action.TURN_RIGHT
+        elif action == "TURN_TURRET_LEFT":
+            tank.next_action = Action.TURN_TURRET_LEFT
+        elif action == "TURN_TURRET_RIGHT":
+            tank.next_action = Action.TURN_TURRET_RIGHT
+        elif action == "FIRE":
+            tank.next_action = Action.FIRE
+        elif action == "SCAN":
+            tank.next_action = Action.SCAN
+        else:
+            tank.next_action = None
@@ -1,13 +1,27 @@
 from tankwar.logic.arena import Arena
+from tankwar.logic.entity_pool import EntityPool
+from tankwar.logic.entity_registry import EntityRegistry
 from tankwar.logic.missile import Missile
+from tankwar.logic.missile_array import MissileArray
 from tankwar.logic.tank import Tank
 
 class TankFirer:
 
-    def __init__(self, arena: Arena, missiles: list[Missile]):
+    def __init__(self, arena: Arena, missiles: list[Missile], registry: EntityRegistry, missile_pool: EntityPool = None):
         self.arena = arena  
         self.missiles = missiles
+        self.registry = registry
+        self.missile_pool = missile_pool or EntityPool(Missile)
+        self.next_missile_id = 0
 
     def fire(self, tank: Tank):
-        missile = Missile(tank.x, tank.y, tank.turret_orientation, tank.color)
-        self.missiles.append(missile)
\ No newline at end of file
+        missile = self.missile_pool.acquire(tank.x, tank.y, tank.turret_orientation, tank.color, self.next_missile_id)
+        if isinstance(self.missiles, MissileArray):
+            # Missiles of the array are not registered, they are numbered instead
+            self.next_missile_id += 1
+            self.missiles.append(missile)
+            # The array copied the missile
+            self.missile_pool.release(missile)
+        else:
+            self.registry.add(missile)
+            self.arena.missile_index.add(missile)
\ No newline at end of file
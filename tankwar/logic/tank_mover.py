@@ -4,9 +4,6 @@ from tankwar.logic.tank import Tank
 
 class TankMover:
 
-    def __init__(self, tanks: list[Tank]):
-        self.tanks = tanks
-
     def move_backward(self, tank: Tank, arena: Arena):
         x0, y0 = tank.x, tank.y
         match tank.orientation:
@@ -19,8 +16,10 @@ class TankMover:
             case Orientation.WEST:
                 tank.x += 1
         self.handle_movement_out_of_arena(tank, arena)
-        if self.is_collision_with_tank(tank):
+        if self.is_collision_with_tank(tank, arena):
             tank.x, tank.y = x0, y0
+            return
+        arena.tank_index.move(tank, x0, y0)
 
     def move_forward(self, tank: Tank, arena: Arena):
         x0, y0 = tank.x, tank.y
@@ -34,12 +33,14 @@ class TankMover:
             case Orientation.WEST:
                 tank.x -= 1
         self.handle_movement_out_of_arena(tank, arena)
-        if self.is_collision_with_tank(tank):
+        if self.is_collision_with_tank(tank, arena):
             tank.x, tank.y = x0, y0
+            return
+        arena.tank_index.move(tank, x0, y0)
 
-    def is_collision_with_tank(self, tank: Tank):
-        for other_tank in self.tanks:
-            if tank != other_tank and tank.x == other_tank.x and tank.y == other_tank.y:
+    def is_collision_with_tank(self, tank: Tank, arena: Arena):
+        for other_tank in arena.tank_index.at(tank.x, tank.y):
+            if tank != other_tank:
                 return True 
         return False 
       
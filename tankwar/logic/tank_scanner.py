@@ -1,10 +1,14 @@
 import json
 from tankwar.logic.arena import Arena
+from tankwar.logic.entity_registry import EntityRegistry
 from tankwar.logic.missile import Missile
 from tankwar.logic.tank import Tank
 from tankwar.logic.target import Target
 
 class ScanResult:
+
+    __slots__ = ("turn", "x", "y", "color", "orientation", "turret_orientation", "target_x", "target_y")
+
     def __init__(self, turn:int, x: int, y: int, color: str, orientation: str, turret_orientation: str, target_x: int, target_y: int):
         self.turn = turn 
         self.x = x
@@ -30,15 +34,23 @@ class ScanResult:
     
 class TankScanner:
 
-    def __init__(self, arena: Arena, missiles: list[Missile], tanks: list[Tank], targets: list[Target]):
+    def __init__(self, arena: Arena, missiles: list[Missile], tanks: list[Tank], targets: list[Target], registry: EntityRegistry, write_files: bool = True):
         self.arena = arena  
         self.missiles = missiles
         self.tanks = tanks
         self.targets = targets
+        self.registry = registry
+        # Headless games keep the scans in process, parallel games would share the files
+        self.write_files = write_files
+        self.bytes_written = 0
 
-    def scan(self, turn : int, tank: Tank):
-        target = [target for target in self.targets if target.color == tank.color][0]
-        scan = ScanResult(turn, tank.x, tank.y, tank.color, tank.orientation, tank.turret_orientation, target.x, target.y)
-        with open(f"{tank.color}_scan.txt", "w") as f:
-            f.write(scan.to_json())
-        print(f"Tank {tank.color} scanned at turn {turn}: {scan.to_json()}")
\ No newline at end of file
+    def scan(self, turn : int, tank: Tank) -> ScanResult:
+        target = self.registry.first_of_color("targets", tank.color)
+        # No target when the arena was too full to respawn it
+        target_x, target_y = (target.x, target.y) if target is not None else (None, None)
+        scan = ScanResult(turn, tank.x, tank.y, tank.color, tank.orientation, tank.turret_orientation, target_x, target_y)
+        if self.write_files:
+            with open(f"{tank.color}_scan.txt", "w") as f:
+                self.bytes_written += f.write(scan.to_json())
+            print(f"Tank {tank.color} scanned at turn {turn}: {scan.to_json()}")
+        return scan
\ No newline at end of file
@@ -1,4 +1,6 @@
 from tankwar.logic.arena import Arena
+from tankwar.logic.entity_pool import EntityPool
+from tankwar.logic.entity_registry import EntityRegistry
 from tankwar.logic.missile import Missile
 from tankwar.logic.tank import Action, Tank
 
@@ -9,11 +11,11 @@ from tankwar.logic.target import Target
 
 class TankUpdater:
 
-    def __init__(self, arena: Arena, missiles: list[Missile], tanks: list[Tank], targets: list[Target]):
+    def __init__(self, arena: Arena, missiles: list[Missile], tanks: list[Tank], targets: list[Target], registry: EntityRegistry, missile_pool: EntityPool = None, write_scans: bool = True):
         self.arena = arena  
-        self.tank_mover = TankMover(tanks)
-        self.tank_firer = TankFirer(arena, missiles)
-        self.tank_scanner = TankScanner(arena, missiles, tanks, targets)
+        self.tank_mover = TankMover()
+        self.tank_firer = TankFirer(arena, missiles, registry, missile_pool)
+        self.tank_scanner = TankScanner(arena, missiles, tanks, targets, registry, write_scans)
 
     def update(self, turn : int, tank: Tank):
         action = tank.next_action
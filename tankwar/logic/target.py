@@ -1,6 +1,9 @@
 class Target:
 
-    def __init__(self, x:int, y:int, color:str):        
+    __slots__ = ("id", "x", "y", "color")
+
+    def __init__(self, x:int, y:int, color:str, target_id:int = 0):        
+        self.id = target_id
         self.x = x
         self.y = y
         self.color = color
@@ -1,36 +1,35 @@
-import random
 from tankwar.logic.arena import Arena
+from tankwar.logic.entity_registry import EntityRegistry
+from tankwar.logic.spawn_placer import SpawnPlacer
 from tankwar.logic.tank import Tank
 from tankwar.logic.target import Target
 
 class TargetCollider:
 
-    def __init__(self, arena:Arena, targets: list[Target], tanks: list[Tank], scores: dict[str, int]):
+    def __init__(self, arena:Arena, targets: list[Target], tanks: list[Tank], scores: dict[str, int], registry: EntityRegistry, spawn_placer: SpawnPlacer):
         self.targets = targets
+        self.registry = registry
         self.tanks = tanks  
         self.arena = arena
         self.scores = scores
+        self.spawn_placer = spawn_placer
 
     def collide(self):
         
-        targets_to_remove = set()
-
-        for i in range(0, len(self.targets)):
-            for j in range(0, len(self.tanks)):
-                target, tank = self.targets[i], self.tanks[j]
-                if target.color == tank.color and target.x == tank.x and tank.y == target.y:
-                    targets_to_remove.add(target)
-                    break
+        targets_to_remove = [
+            target for target in self.targets
+            if any(tank.color == target.color for tank in self.arena.tank_index.at(target.x, target.y))
+        ]
         
         for target in targets_to_remove:
-            self.targets.remove(target)
+            self.registry.remove(target)
+            self.arena.target_index.remove(target)
             self.scores[target.color] += 1
-            x, y = None, None
-            while True:
-                x = random.randint(0, self.arena.cell_per_row - 1)
-                y = random.randint(0, self.arena.cell_per_col - 1)
-                if not any(t.x == x and t.y == y for t in self.tanks) and not any(t.x == x and t.y == y for t in self.targets):
-                    break  
-            self.targets.append(Target(x, y, target.color)) 
-            
-        
\ No newline at end of file
+            # The tank that reached the target stands on it
+            cell = self.spawn_placer.target_position((target.x, target.y))
+            if cell is None:
+                # No cell left without a tank or a target
+                continue
+            new_target = Target(*cell, target.color)
+            self.registry.add(new_target)
+            self.arena.target_index.add(new_target)
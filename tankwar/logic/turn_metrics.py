@@ -0,0 +1,95 @@
+import time
+from collections import deque
+
+class RollingHistogram:
+    """
+    The last `size` samples of a measure, to report its recent percentiles.
+    """
+
+    def __init__(self, size: int = 1024):
+        self.samples = deque(maxlen=size)
+
+    def add(self, value: float):
+        self.samples.append(value)
+
+    def percentiles(self) -> dict[str, float]:
+        if not self.samples:
+            return {"count": 0}
+        samples = sorted(self.samples)
+        last = len(samples) - 1
+        return {
+            "count": len(samples),
+            "p50": samples[last * 50 // 100],
+            "p95": samples[last * 95 // 100],
+            "p99": samples[last * 99 // 100],
+            "max": samples[last],
+        }
+
+class PhaseTimer:
+
+    def __init__(self, histogram: RollingHistogram):
+        self.histogram = histogram
+        self.start = 0.
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.histogram.add(time.perf_counter() - self.start)
+
+class TurnMetrics:
+    """
+    Timings of every phase of the turn pipeline over the last turns, with the
+    entity counts and bytes written at the last turn.
+
+        with metrics.phase("tanks"):
+            ...
+
+    costs two perf_counter calls and a deque append.
+    """
+
+    def __init__(self, window: int = 1024):
+        self.window = window
+        self.histograms: dict[str, RollingHistogram] = {}
+        self.timers: dict[str, PhaseTimer] = {}
+        self.counts: dict[str, int] = {}
+        self.bytes_written: dict[str, int] = {}
+
+    def phase(self, name: str) -> PhaseTimer:
+        timer = self.timers.get(name)
+        if timer is None:
+            self.histograms[name] = RollingHistogram(self.window)
+            timer = self.timers[name] = PhaseTimer(self.histograms[name])
+        return timer
+
+    def count(self, game: "Game"):
+        self.counts = {
+            "turn": game.turn,
+            "tanks": len(game.tanks),
+            "missiles": len(game.missiles),
+            "targets": len(game.targets),
+            "explosions": len(game.explosions),
+        }
+        self.bytes_written = {
+            "ipc": game.game_writer.bytes_written,
+            "files": game.tank_updater.tank_scanner.bytes_written,
+        }
+
+    def summary(self) -> dict:
+        """
+        Percentiles in milliseconds, by phase, with the counts and bytes written.
+        """
+        phases = {}
+        for name, histogram in self.histograms.items():
+            phases[name] = {key: value if key == "count" else round(value * 1000, 3) for key, value in histogram.percentiles().items()}
+        return {"phases": phases, "counts": self.counts, "bytes_written": self.bytes_written}
+
+    def summary_line(self) -> str:
+        summary = self.summary()
+        phases = " ".join(
+            f"{name} {timing['p50']}/{timing['p95']}/{timing['p99']}"
+            for name, timing in summary["phases"].items() if timing["count"]
+        )
+        counts = " ".join(f"{name} {count}" for name, count in summary["counts"].items())
+        written = " ".join(f"{name} {size / 1024:.0f} kB" for name, size in summary["bytes_written"].items())
+        return f"{counts} | ms p50/p95/p99: {phases} | written: {written}"
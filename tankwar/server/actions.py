@@ -0,0 +1,24 @@
+def validate_actions(data) -> tuple[list[tuple[str, int, str]], list[dict]]:
+    if not isinstance(data, list):
+        return [], [{'error': 'a list of actions is required'}]
+
+    entries, errors = [], []
+    for index, entry in enumerate(data):
+        if not isinstance(entry, dict):
+            errors.append({'index': index, 'error': 'each action must be an object'})
+            continue
+        action = entry.get('action')
+        turn = entry.get('turn')
+        color = entry.get('color')
+        # Turn 0 is the first turn of a match, not a missing turn
+        if not action or turn is None or not color:
+            errors.append({'index': index, 'error': 'action, turn and color fields are required'})
+            continue
+        if not isinstance(action, str) or not isinstance(color, str):
+            errors.append({'index': index, 'error': 'action and color must be strings'})
+            continue
+        try :
+            entries.append((color, int(turn), action))
+        except (TypeError, ValueError):
+            errors.append({'index': index, 'error': 'turn must be an integer'})
+    return entries, errors
@@ -0,0 +1,344 @@
+import asyncio
+import json
+from urllib.parse import parse_qs
+
+from tankwar.logic.action_listener import ActionSender
+from tankwar.logic.game_delta import deltas_since
+from tankwar.logic.snapshot_codec import SNAPSHOT_MEDIA_TYPE, snapshot_match, snapshot_to_json
+from tankwar.logic.state_channel import DELTA_CHANNEL_NAME, METRICS_CHANNEL_NAME, STATE_CHANNEL_NAME, reopen
+from tankwar.server.actions import validate_actions
+
+class GameState:
+    """
+    In-memory copy of the latest snapshot published by the game.
+
+    A single background task watches the shared memory channel and wakes up
+    every waiting long-poll request when the turn changes, so the number of
+    pending requests does not add any load on the channel. The channels are
+    reopened when the game restarts, and the state is dropped while no game
+    runs.
+    """
+
+    def __init__(self, poll_interval: float = 0.01):
+        self.poll_interval = poll_interval
+        self.channel = None
+        self.sequence = None
+        self.turn = None
+        self.content = None
+        self.json_content = None
+        self.delta_channel = None
+        self.delta_sequence = None
+        self.delta_log = None
+        self.turn_changed = asyncio.Condition()
+
+    async def watch(self):
+        while True:
+            try:
+                await self.refresh()
+            except FileNotFoundError:
+                # The game has not been started yet, or exited
+                await self.game_stopped()
+            await asyncio.sleep(self.poll_interval)
+
+    async def refresh(self):
+        channel = reopen(self.channel, STATE_CHANNEL_NAME)
+        if channel is not self.channel:
+            self.channel = channel
+            self.sequence = None
+        await self.refresh_deltas()
+        sequence = self.channel.read_sequence()
+        if sequence == self.sequence:
+            return
+        # In a thread: a read waits for a publish in progress to complete
+        turn, content = await asyncio.to_thread(self.channel.read)
+        self.sequence = sequence
+        self.content = content
+        self.json_content = None
+        if turn != self.turn:
+            self.turn = turn
+            async with self.turn_changed:
+                self.turn_changed.notify_all()
+
+    async def refresh_deltas(self):
+        channel = reopen(self.delta_channel, DELTA_CHANNEL_NAME)
+        if channel is not self.delta_channel:
+            self.delta_channel = channel
+            self.delta_sequence = None
+        sequence = self.delta_channel.read_sequence()
+        if sequence == self.delta_sequence:
+            return
+        _, content = await asyncio.to_thread(self.delta_channel.read)
+        self.delta_sequence = sequence
+        self.delta_log = json.loads(content)
+
+    async def game_stopped(self):
+        self.channel = None
+        self.delta_channel = None
+        self.sequence = None
+        self.delta_sequence = None
+        self.content = None
+        self.json_content = None
+        self.delta_log = None
+        if self.turn is not None:
+            self.turn = None
+            # Waiting requests answer that the game is not running
+            async with self.turn_changed:
+                self.turn_changed.notify_all()
+
+    def json_view(self) -> bytes:
+        if self.json_content is None:
+            self.json_content = snapshot_to_json(self.content).encode("utf-8")
+        return self.json_content
+
+    async def wait_for_turn(self, after: int, timeout: float) -> int:
+        async with self.turn_changed:
+            try:
+                await asyncio.wait_for(self.turn_changed.wait_for(lambda: self.turn != after), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self.turn
+
+game_state = None
+metrics_channel = None
+action_sender = ActionSender()
+
+async def send_response(send, status: int, body: bytes, content_type: bytes = b"application/json"):
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", content_type), (b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+async def send_json(send, json_dict, status: int = 200):
+    await send_response(send, status, json.dumps(json_dict).encode("utf-8"))
+
+async def send_text(send, text: str, status: int = 200):
+    await send_response(send, status, text.encode("utf-8"), b"text/html; charset=utf-8")
+
+async def read_body(receive) -> bytes:
+    body = b""
+    while True:
+        message = await receive()
+        body += message.get("body", b"")
+        if not message.get("more_body"):
+            return body
+
+def write_status(status: str):
+    with open("game_status.txt", "w") as file:
+        file.write(status)
+
+def read_scan(color: str):
+    try :
+        with open(f"{color}_scan.txt", "r") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+async def hello(scope, receive, send):
+    await send_json(send, {"message": "Hello World"})
+
+async def set_action(scope, receive, send):
+    try :
+        data = json.loads(await read_body(receive))
+    except ValueError:
+        return await send_json(send, {'error': 'invalid JSON body'}, 400)
+
+    # Validated like an entry of /actions, so that both accept the same actions
+    entries, errors = validate_actions([data])
+    if errors:
+        return await send_json(send, {'error': errors[0]['error']}, 400)
+    color, turn, action = entries[0]
+
+    try :
+        await asyncio.to_thread(action_sender.send, color, turn, action)
+    except ConnectionRefusedError:
+        return await send_json(send, {'error': 'the game is not running'}, 503)
+
+    await send_json(send, {
+        'action': action,
+        'turn': turn,
+        'color': color
+    })
+
+async def set_actions(scope, receive, send):
+    try :
+        data = json.loads(await read_body(receive))
+    except ValueError:
+        return await send_json(send, {'error': 'invalid JSON body'}, 400)
+
+    entries, errors = validate_actions(data)
+    if errors:
+        return await send_json(send, {'errors': errors}, 400)
+
+    try :
+        await asyncio.to_thread(action_sender.send_many, entries)
+    except ConnectionRefusedError:
+        return await send_json(send, {'error': 'the game is not running'}, 503)
+
+    await send_json(send, [
+        {'action': action, 'turn': turn, 'color': color} for color, turn, action in entries
+    ])
+
+async def get_scan(scope, receive, send, color):
+    scan = await asyncio.to_thread(read_scan, color)
+    if scan is None:
+        return await send_json(send, {})
+    await send_json(send, {
+        "scan": scan,
+        "color": color
+    })
+
+async def get_turn(scope, receive, send):
+    if game_state.turn is None:
+        return await send_json(send, {'error': 'the game is not running'}, 503)
+    await send_text(send, str(game_state.turn))
+
+async def wait_turn(scope, receive, send):
+    if game_state.turn is None:
+        return await send_json(send, {'error': 'the game is not running'}, 503)
+    query = parse_qs(scope["query_string"].decode("latin-1"))
+    try :
+        after = int(query["after"][0]) if "after" in query else None
+        timeout = min(float(query["timeout"][0]) if "timeout" in query else 30., 60.)
+    except ValueError:
+        return await send_json(send, {'error': 'after must be an integer and timeout a number'}, 400)
+    if after is None:
+        return await send_text(send, str(game_state.turn))
+    turn = await game_state.wait_for_turn(after, timeout)
+    if turn is None:
+        return await send_json(send, {'error': 'the game is not running'}, 503)
+    await send_text(send, str(turn))
+
+async def wait_for_disconnect(receive):
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+async def send_turns(send, turn: int):
+    try :
+        while True:
+            new_turn = await game_state.wait_for_turn(turn, 15.)
+            if new_turn is None:
+                # The game exited
+                break
+            if new_turn == turn:
+                # Keep idle connections alive through proxies
+                await send({"type": "http.response.body", "body": b": keep-alive\n\n", "more_body": True})
+                continue
+            turn = new_turn
+            await send({"type": "http.response.body", "body": f"data: {turn}\n\n".encode(), "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+    except OSError:
+        # The client went away
+        return
+
+async def stream_turns(scope, receive, send):
+    if game_state.turn is None:
+        return await send_json(send, {'error': 'the game is not running'}, 503)
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [(b"content-type", b"text/event-stream"), (b"cache-control", b"no-cache")],
+    })
+    turn = game_state.turn
+    await send({"type": "http.response.body", "body": f"data: {turn}\n\n".encode(), "more_body": True})
+    # The server does not fail sends to a closed connection, so the stream stops on the disconnect message
+    streaming = asyncio.create_task(send_turns(send, turn))
+    disconnected = asyncio.create_task(wait_for_disconnect(receive))
+    await asyncio.wait({streaming, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+    streaming.cancel()
+    disconnected.cancel()
+
+async def get_game_status(scope, receive, send):
+    if game_state.content is None:
+        return await send_json(send, {'error': 'the game is not running'}, 503)
+    accept = dict(scope["headers"]).get(b"accept", b"").decode("latin-1")
+    if SNAPSHOT_MEDIA_TYPE in accept:
+        return await send_response(send, 200, game_state.content, SNAPSHOT_MEDIA_TYPE.encode())
+    await send_response(send, 200, game_state.json_view())
+
+async def get_game_status_delta(scope, receive, send):
+    if game_state.content is None or game_state.delta_log is None:
+        return await send_json(send, {'error': 'the game is not running'}, 503)
+    query = parse_qs(scope["query_string"].decode("latin-1"))
+    try :
+        since = int(query["since"][0]) if "since" in query else None
+        match = int(query["match"][0]) if "match" in query else None
+    except ValueError:
+        return await send_json(send, {'error': 'since and match must be integers'}, 400)
+
+    delta_log = game_state.delta_log
+    deltas = deltas_since(delta_log, since, match)
+    if deltas is not None:
+        return await send_json(send, {"match": delta_log["match"], "turn": delta_log["turn"], "status": delta_log["status"], "keyframe": False, "deltas": deltas})
+
+    # Too far behind, or another match: send the whole state and let the client start over from it
+    head = f'{{"match": {snapshot_match(game_state.content)}, "turn": {game_state.turn}, "status": {json.dumps(delta_log["status"])}, "keyframe": true, "state": '
+    await send_response(send, 200, head.encode("utf-8") + game_state.json_view() + b"}")
+
+async def get_metrics(scope, receive, send):
+    global metrics_channel
+    try :
+        metrics_channel = reopen(metrics_channel, METRICS_CHANNEL_NAME)
+        _, content = await asyncio.to_thread(metrics_channel.read)
+    except FileNotFoundError:
+        metrics_channel = None
+        return await send_json(send, {'error': 'no metrics published yet'}, 503)
+    await send_response(send, 200, content)
+
+async def pause_game(scope, receive, send):
+    await asyncio.to_thread(write_status, "PAUSED")
+    await send_json(send, {"status": "Game paused"})
+
+async def run_game(scope, receive, send):
+    await asyncio.to_thread(write_status, "RUNNING")
+    await send_json(send, {"status": "Game running"})
+
+async def reset_game(scope, receive, send):
+    await asyncio.to_thread(write_status, "RESET")
+    await send_json(send, {"status": "Game reset"})
+
+ROUTES = {
+    ("GET", "/"): hello,
+    ("POST", "/action"): set_action,
+    ("POST", "/actions"): set_actions,
+    ("GET", "/turn"): get_turn,
+    ("GET", "/turn/wait"): wait_turn,
+    ("GET", "/turn/stream"): stream_turns,
+    ("GET", "/status"): get_game_status,
+    ("GET", "/status/delta"): get_game_status_delta,
+    ("GET", "/metrics"): get_metrics,
+    ("POST", "/game/pause"): pause_game,
+    ("POST", "/game/run"): run_game,
+    ("POST", "/game/reset"): reset_game,
+}
+
+async def lifespan(scope, receive, send):
+    global game_state
+    watcher = None
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            game_state = GameState()
+            watcher = asyncio.create_task(game_state.watch())
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            watcher.cancel()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        return await lifespan(scope, receive, send)
+
+    method, path = scope["method"], scope["path"]
+    handler = ROUTES.get((method, path))
+    if handler is not None:
+        return await handler(scope, receive, send)
+    if method == "GET" and path.startswith("/scan/"):
+        return await get_scan(scope, receive, send, path[len("/scan/"):])
+    await send_json(send, {'error': 'not found'}, 404)
+
+if __name__ == '__main__':
+    import uvicorn
+    uvicorn.run(app, host="0.0.0.0", port=5000, log_level="warning")
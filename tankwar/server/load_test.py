@@ -0,0 +1,52 @@
+import argparse
+import threading
+import time
+
+import requests
+
+def hammer(url: str, deadline: float, latencies: list[float], errors: list[int]):
+    session = requests.Session()
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            response = session.get(url)
+            if response.status_code != 200:
+                errors.append(response.status_code)
+                continue
+        except requests.exceptions.RequestException:
+            errors.append(0)
+            continue
+        latencies.append(time.perf_counter() - start)
+
+def percentile(values: list[float], ratio: float) -> float:
+    if not values:
+        return 0.
+    return sorted(values)[min(len(values) - 1, int(len(values) * ratio))]
+
+def load_test(base_url: str, path: str, concurrency: int, duration: float):
+    url = base_url.rstrip("/") + path
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+    threads = [threading.Thread(target=hammer, args=(url, deadline, latencies, errors)) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    print(f"{url}: {len(latencies) / elapsed:.0f} requests/s, "
+          f"p50 {percentile(latencies, 0.5) * 1000:.1f} ms, "
+          f"p99 {percentile(latencies, 0.99) * 1000:.1f} ms, "
+          f"{len(errors)} errors")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compare the request throughput of game servers.")
+    parser.add_argument("servers", nargs="+", help="base URLs, e.g. http://127.0.0.1:5000 http://127.0.0.1:8000")
+    parser.add_argument("--path", default="/turn")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.)
+    args = parser.parse_args()
+
+    for server in args.servers:
+        load_test(server, args.path, args.concurrency, args.duration)
@@ -1,6 +1,12 @@
 import json
-import time
-from flask import Flask, request, jsonify
+
+from flask import Flask, Response, request, jsonify
+
+from tankwar.logic.action_listener import ActionSender
+from tankwar.logic.game_delta import deltas_since
+from tankwar.logic.snapshot_codec import SNAPSHOT_MEDIA_TYPE, snapshot_match, snapshot_to_json
+from tankwar.logic.state_channel import DELTA_CHANNEL_NAME, METRICS_CHANNEL_NAME, STATE_CHANNEL_NAME, reopen
+from tankwar.server.actions import validate_actions
 
 import logging
 log = logging.getLogger('werkzeug')
@@ -8,23 +14,81 @@ log.setLevel(logging.ERROR)
 
 app = Flask(__name__)
 
+state_channel = None
+# JSON view of the latest snapshot, with the channel, sequence number and turn it was built from
+json_view = (None, None, None, None, None)
+delta_channel = None
+# Parsed delta log, with the channel and sequence number it was read at
+delta_view = (None, None, None)
+metrics_channel = None
+action_sender = ActionSender()
+
+# The channels are reopened when the game restarts, and raise FileNotFoundError while no game runs
+
+def get_state_channel():
+    global state_channel
+    try :
+        state_channel = reopen(state_channel, STATE_CHANNEL_NAME)
+    except FileNotFoundError:
+        state_channel = None
+        raise
+    return state_channel
+
+def get_delta_channel():
+    global delta_channel
+    try :
+        delta_channel = reopen(delta_channel, DELTA_CHANNEL_NAME)
+    except FileNotFoundError:
+        delta_channel = None
+        raise
+    return delta_channel
+
+def get_metrics_channel():
+    global metrics_channel
+    try :
+        metrics_channel = reopen(metrics_channel, METRICS_CHANNEL_NAME)
+    except FileNotFoundError:
+        metrics_channel = None
+        raise
+    return metrics_channel
+
+def read_json_view(channel):
+    global json_view
+    sequence = channel.read_sequence()
+    cached_channel, cached_sequence, turn, match, content = json_view
+    if cached_channel is not channel or cached_sequence != sequence:
+        turn, snapshot = channel.read()
+        match = snapshot_match(snapshot)
+        content = snapshot_to_json(snapshot)
+        json_view = (channel, sequence, turn, match, content)
+    return turn, match, content
+
+def read_delta_log(channel) -> dict:
+    global delta_view
+    sequence = channel.read_sequence()
+    cached_channel, cached_sequence, delta_log = delta_view
+    if cached_channel is not channel or cached_sequence != sequence:
+        _, content = channel.read()
+        delta_log = json.loads(content)
+        delta_view = (channel, sequence, delta_log)
+    return delta_log
+
 @app.route("/")
 def hello():
     return {"message": "Hello World"}
 
 @app.route('/action', methods=['POST'])
 def set_action():
-    data = request.get_json()
-
-    action = data.get('action')
-    turn = data.get('turn')
-    color = data.get('color')
-
-    if not action or not turn or not color:
-        return jsonify({'error': 'action, turn and color fields are required'}), 400
+    # Validated like an entry of /actions, so that both accept the same actions
+    entries, errors = validate_actions([request.get_json(silent=True)])
+    if errors:
+        return jsonify({'error': errors[0]['error']}), 400
+    color, turn, action = entries[0]
 
-    with open(f"{color}_action_{turn}.txt", "w") as f:
-        f.write(action)
+    try :
+        action_sender.send(color, turn, action)
+    except ConnectionRefusedError:
+        return jsonify({'error': 'the game is not running'}), 503
 
     return jsonify({
         'action': action,
@@ -32,6 +96,20 @@ def set_action():
         'color': color
     })
 
+@app.route('/actions', methods=['POST'])
+def set_actions():
+    entries, errors = validate_actions(request.get_json(silent=True))
+    if errors:
+        return jsonify({'errors': errors}), 400
+
+    try :
+        action_sender.send_many(entries)
+    except ConnectionRefusedError:
+        return jsonify({'error': 'the game is not running'}), 503
+
+    return jsonify([
+        {'action': action, 'turn': turn, 'color': color} for color, turn, action in entries
+    ])
 
 @app.route('/action/<color>', methods=['GET'])
 def get_action(color):
@@ -58,20 +136,94 @@ def get_scan(color):
 @app.route("/turn")
 def get_turn():
     try :
-        with open("game.json", "r") as f:
-            content = f.read()
-        json_dict = json.loads(content)
-    except json.JSONDecodeError:
-        with open("game.json", "r") as f:
-            content = f.read()
-            json_dict = json.loads(content)
-    return str(json_dict["turn"])
+        return str(get_state_channel().read_turn())
+    except FileNotFoundError:
+        return jsonify({'error': 'the game is not running'}), 503
+
+@app.route("/turn/wait")
+def wait_turn():
+    try :
+        after = int(request.args["after"]) if "after" in request.args else None
+        timeout = min(float(request.args["timeout"]) if "timeout" in request.args else 30., 60.)
+    except ValueError:
+        return jsonify({'error': 'after must be an integer and timeout a number'}), 400
+    try :
+        channel = get_state_channel()
+        if after is None:
+            return str(channel.read_turn())
+        turn = channel.wait_for_turn(after, timeout)
+    except FileNotFoundError:
+        return jsonify({'error': 'the game is not running'}), 503
+    if not channel.is_live():
+        return jsonify({'error': 'the game is not running'}), 503
+    return str(turn)
+
+@app.route("/turn/stream")
+def stream_turns():
+    try :
+        channel = get_state_channel()
+        turn = channel.read_turn()
+    except FileNotFoundError:
+        return jsonify({'error': 'the game is not running'}), 503
+
+    def turn_events(turn):
+        yield f"data: {turn}\n\n"
+        while channel.is_live():
+            try :
+                new_turn = channel.wait_for_turn(turn, 15.)
+            except FileNotFoundError:
+                return
+            if new_turn == turn:
+                # Keep idle connections alive through proxies
+                yield ": keep-alive\n\n"
+                continue
+            turn = new_turn
+            yield f"data: {turn}\n\n"
+
+    return Response(turn_events(turn), mimetype="text/event-stream")
 
 @app.route("/status")
 def get_game_status():
-    with open("game.json", "r") as f:
-        content = f.read()
-    return content
+    try :
+        channel = get_state_channel()
+        if SNAPSHOT_MEDIA_TYPE in request.headers.get("Accept", ""):
+            _, content = channel.read()
+            return Response(content, mimetype=SNAPSHOT_MEDIA_TYPE)
+        _, _, content = read_json_view(channel)
+    except FileNotFoundError:
+        return jsonify({'error': 'the game is not running'}), 503
+    return Response(content, mimetype="application/json")
+
+@app.route("/status/delta")
+def get_game_status_delta():
+    try :
+        since = int(request.args["since"]) if "since" in request.args else None
+        match = int(request.args["match"]) if "match" in request.args else None
+    except ValueError:
+        return jsonify({'error': 'since and match must be integers'}), 400
+    try :
+        channel = get_state_channel()
+        delta_log = read_delta_log(get_delta_channel())
+        deltas = deltas_since(delta_log, since, match)
+        if deltas is None:
+            turn, match, state = read_json_view(channel)
+    except FileNotFoundError:
+        return jsonify({'error': 'the game is not running'}), 503
+
+    if deltas is not None:
+        return jsonify({"match": delta_log["match"], "turn": delta_log["turn"], "status": delta_log["status"], "keyframe": False, "deltas": deltas})
+
+    # Too far behind, or another match: send the whole state and let the client start over from it
+    content = f'{{"match": {match}, "turn": {turn}, "status": {json.dumps(delta_log["status"])}, "keyframe": true, "state": {state}}}'
+    return Response(content, mimetype="application/json")
+
+@app.route("/metrics")
+def get_metrics():
+    try :
+        _, content = get_metrics_channel().read()
+    except FileNotFoundError:
+        return jsonify({'error': 'no metrics published yet'}), 503
+    return Response(content, mimetype="application/json")
 
 @app.route("/game/pause", methods=["POST"])
 def pause_game():
@@ -0,0 +1,86 @@
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from tankwar.ai.bots import BOTS
+from tankwar.logic.colors import player_names
+from tankwar.logic.game import Game
+from tankwar.logic.game_config import GameConfig
+
+def play_match(matchup: tuple[str, ...], seed: int, turns: int, arena_size: int = 50) -> dict[str, int]:
+    """
+    Play a headless match between in-process bots, one tank per bot name in
+    the matchup, and return the score of every player.
+    """
+    config = GameConfig.scaled(arena_size, len(matchup), spawn_policy="random", seed=seed)
+    game = Game(config, headless=True)
+    for i, (color, name) in enumerate(zip(config.players, matchup)):
+        game.bots[color] = BOTS[name](seed * len(matchup) + i)
+    game.run_turns(turns)
+    return dict(game.scores)
+
+def play_task(task: tuple[tuple[str, ...], int, int, int]):
+    matchup, seed, turns, arena_size = task
+    return matchup, seed, play_match(matchup, seed, turns, arena_size)
+
+def run_tournament(matchups: list[tuple[str, ...]], seeds: list[int], turns: int, arena_size: int = 50, workers: int = None):
+    """
+    Play every matchup once per seed, spread over a pool of processes, and
+    yield (matchup, seed, scores) as the matches end.
+    """
+    tasks = [(matchup, seed, turns, arena_size) for matchup in matchups for seed in seeds]
+    with ProcessPoolExecutor(workers) as executor:
+        yield from executor.map(play_task, tasks)
+
+def results_table(results) -> list[tuple[str, int, int, int, float]]:
+    """
+    Aggregate the scores of every bot over all its matches, as rows of
+    (bot, matches, wins, total score, mean score) sorted by mean score.
+    A match is won by the bots with the highest score, if it is not zero.
+    A bot playing several tanks of a match counts that match and its win
+    once, its mean score being per tank.
+    """
+    matches, wins, totals, tanks = defaultdict(int), defaultdict(int), defaultdict(int), defaultdict(int)
+    for matchup, _, scores in results:
+        players = player_names(len(matchup))
+        best = max(scores.values())
+        winners = set()
+        for name, player in zip(matchup, players):
+            tanks[name] += 1
+            totals[name] += scores[player]
+            if best > 0 and scores[player] == best:
+                winners.add(name)
+        for name in set(matchup):
+            matches[name] += 1
+        for name in winners:
+            wins[name] += 1
+    rows = [(name, matches[name], wins[name], totals[name], totals[name] / tanks[name]) for name in matches]
+    return sorted(rows, key=lambda row: row[4], reverse=True)
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description="Play headless matches between in-process bots on all cores")
+    parser.add_argument("--matchup", action="append", help=f"comma separated bots of one match, among {', '.join(BOTS)}; can be repeated")
+    parser.add_argument("--seeds", type=int, default=10, help="number of matches per matchup")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--turns", type=int, default=1000)
+    parser.add_argument("--arena-size", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    matchups = [tuple(matchup.split(",")) for matchup in args.matchup or ["random,random,seeker,seeker"]]
+    for matchup in matchups:
+        for name in matchup:
+            if name not in BOTS:
+                parser.error(f"unknown bot {name}, expected one of {', '.join(BOTS)}")
+    seeds = list(range(args.first_seed, args.first_seed + args.seeds))
+
+    started = time.perf_counter()
+    results = list(run_tournament(matchups, seeds, args.turns, args.arena_size, args.workers))
+    elapsed = time.perf_counter() - started
+
+    print(f"{'bot':<12}{'matches':>8}{'wins':>6}{'score':>8}{'mean':>8}")
+    for name, matches, wins, total, mean in results_table(results):
+        print(f"{name:<12}{matches:>8}{wins:>6}{total:>8}{mean:>8.2f}")
+    print(f"{len(results)} matches of {args.turns} turns in {elapsed:.1f} s with {args.workers} workers, {len(results) * 3600 / elapsed:.0f} matches/hour")